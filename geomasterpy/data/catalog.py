@@ -10,6 +10,19 @@ import json
 import geopandas as gpd
 from io import StringIO
 
+from ..net import SESSION
+
+
+def _ensure_initialized() -> None:
+    """
+    Initialize Earth Engine unless this process already has.
+    
+    Re-running ee.Initialize() repeats the auth round trip and would reset
+    an endpoint (e.g. high-volume) chosen by the caller.
+    """
+    if not ee.data.is_initialized():
+        ee.Initialize()
+
 
 def search_ee_data(keywords: str, max_results: int = 20) -> List[Dict[str, Any]]:
     """
@@ -25,7 +38,7 @@ def search_ee_data(keywords: str, max_results: int = 20) -> List[Dict[str, Any]]
     try:
         # Initialize EE if needed
         try:
-            ee.Initialize()
+            _ensure_initialized()
         except:
             print("Warning: Earth Engine not initialized")
             return []
@@ -155,6 +168,48 @@ def search_ee_data(keywords: str, max_results: int = 20) -> List[Dict[str, Any]]
         return []
 
 
+# Basic JavaScript -> Python conversions
+_JS_CONVERSION_RULES = [
+    # Variable declarations
+    (r'\bvar\s+', ''),
+    (r'\blet\s+', ''),
+    (r'\bconst\s+', ''),
+    
+    # Comments
+    (r'//', '#'),
+    
+    # Print statements
+    (r'\bprint\s*\(', 'print('),
+    
+    # Map operations
+    (r'Map\.addLayer\s*\(', 'Map.add_ee_layer('),
+    (r'Map\.centerObject\s*\(', 'Map.center_object('),
+    (r'Map\.setCenter\s*\(', 'Map.set_center('),
+    
+    # Earth Engine objects
+    (r'\bee\.', 'ee.'),
+    
+    # Method chaining (keep as is, but note the difference)
+    # JavaScript uses camelCase, Python uses snake_case for some methods
+    
+    # String methods
+    (r'\.length\b', '.size()'),  # For EE objects
+    
+    # Boolean values
+    (r'\btrue\b', 'True'),
+    (r'\bfalse\b', 'False'),
+    (r'\bnull\b', 'None'),
+    
+    # Semicolons (remove)
+    (r';$', ''),
+    (r';\s*\n', '\n'),
+]
+
+# Compiled once at import rather than on every conversion
+_JS_CONVERSIONS = [(re.compile(pattern, re.MULTILINE), replacement)
+                   for pattern, replacement in _JS_CONVERSION_RULES]
+
+
 def js_snippet_to_python(js_code: str) -> str:
     """
     Convert Google Earth Engine JavaScript code snippets to Python.
@@ -167,46 +222,9 @@ def js_snippet_to_python(js_code: str) -> str:
     """
     python_code = js_code
     
-    # Basic conversions
-    conversions = [
-        # Variable declarations
-        (r'\bvar\s+', ''),
-        (r'\blet\s+', ''),
-        (r'\bconst\s+', ''),
-        
-        # Comments
-        (r'//', '#'),
-        
-        # Print statements
-        (r'\bprint\s*\(', 'print('),
-        
-        # Map operations
-        (r'Map\.addLayer\s*\(', 'Map.add_ee_layer('),
-        (r'Map\.centerObject\s*\(', 'Map.center_object('),
-        (r'Map\.setCenter\s*\(', 'Map.set_center('),
-        
-        # Earth Engine objects
-        (r'\bee\.', 'ee.'),
-        
-        # Method chaining (keep as is, but note the difference)
-        # JavaScript uses camelCase, Python uses snake_case for some methods
-        
-        # String methods
-        (r'\.length\b', '.size()'),  # For EE objects
-        
-        # Boolean values
-        (r'\btrue\b', 'True'),
-        (r'\bfalse\b', 'False'),
-        (r'\bnull\b', 'None'),
-        
-        # Semicolons (remove)
-        (r';$', ''),
-        (r';\s*\n', '\n'),
-    ]
-    
     # Apply conversions
-    for pattern, replacement in conversions:
-        python_code = re.sub(pattern, replacement, python_code, flags=re.MULTILINE)
+    for pattern, replacement in _JS_CONVERSIONS:
+        python_code = pattern.sub(replacement, python_code)
     
     # Handle common EE method name conversions
     ee_method_conversions = [
@@ -420,7 +438,7 @@ def load_geojson_from_drive_url(drive_url: str, timeout: int = 30) -> Optional[D
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        response = requests.get(download_url, headers=headers, timeout=timeout)
+        response = SESSION.get(download_url, headers=headers, timeout=timeout)
         response.raise_for_status()
         
         # Check if we got a redirect page (common with large files)
@@ -433,7 +451,7 @@ def load_geojson_from_drive_url(drive_url: str, timeout: int = 30) -> Optional[D
                 if match:
                     confirm_token = match.group(1)
                     download_url = f"{download_url}&confirm={confirm_token}"
-                    response = requests.get(download_url, headers=headers, timeout=timeout)
+                    response = SESSION.get(download_url, headers=headers, timeout=timeout)
                     response.raise_for_status()
         
         # Parse JSON
@@ -479,7 +497,7 @@ def geojson_to_ee_geometry(geojson_data: Dict[str, Any]) -> Optional[ee.Geometry
     try:
         # Initialize Earth Engine if needed
         try:
-            ee.Initialize()
+            _ensure_initialized()
         except:
             print("Warning: Earth Engine not initialized")
             return None
@@ -7,7 +7,6 @@ Provides functions for exporting Earth Engine data to local files.
 import ee
 import os
 import time
-import requests
 import zipfile
 import json
 from typing import Dict, List, Any, Optional, Union
@@ -18,6 +17,8 @@ import rasterio
 from rasterio.crs import CRS
 import numpy as np
 
+from ..net import SESSION
+
 
 def export_image_to_local(image: ee.Image, filename: str, region: ee.Geometry,
                          scale: int = 30, crs: str = 'EPSG:4326',
@@ -49,7 +50,7 @@ def export_image_to_local(image: ee.Image, filename: str, region: ee.Geometry,
         })
         
         # Download the file
-        response = requests.get(url)
+        response = SESSION.get(url)
         
         if response.status_code == 200:
             # Save as zip file first
@@ -115,7 +116,7 @@ def export_vector_to_local(feature_collection: ee.FeatureCollection,
             return ""
         
         # Download the file
-        response = requests.get(url)
+        response = SESSION.get(url)
         
         if response.status_code == 200:
             if file_format.upper() == 'SHP':
@@ -0,0 +1,34 @@
+"""
+Shared HTTP Session for GeoMasterPy
+
+Provides a single pooled requests.Session so every download reuses
+keep-alive connections for the lifetime of the process.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _make_session(pool_maxsize: int = 20) -> requests.Session:
+    """
+    Create a requests Session with connection pooling and retries.
+    
+    Args:
+        pool_maxsize: Maximum number of pooled connections per host
+        
+    Returns:
+        Configured requests Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=0.1)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+SESSION = _make_session()
@@ -11,12 +11,13 @@ import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
 from matplotlib.colors import LinearSegmentedColormap
 import numpy as np
-import requests
 from PIL import Image
 import io
 from typing import Dict, List, Any, Optional, Tuple, Union
 import warnings
 
+from ..net import SESSION
+
 
 def plot_ee_image_cartopy(image: ee.Image, vis_params: Dict[str, Any], 
                          region: ee.Geometry, figsize: Tuple[int, int] = (12, 8),
@@ -185,7 +186,7 @@ def _get_ee_rgb_image(image: ee.Image, vis_params: Dict[str, Any],
         })
         
         # Download image
-        response = requests.get(url, timeout=30)
+        response = SESSION.get(url, timeout=30)
         if response.status_code == 200:
             # Load image
             pil_image = Image.open(io.BytesIO(response.content))
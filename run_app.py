@@ -1,49 +1,208 @@
 #!/usr/bin/env python3
 """
 Reliable launcher for GeoMasterPy Streamlit app
+
+This is the single entry point behind every launcher script; the others
+call main() with their own port/target and options.
 """
+import http.client
+import os
 import subprocess
 import sys
-import os
+import time
+
+# Directory where this script (and streamlit_app.py) is located
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_PY = sys.executable
 
-def main():
-    """Launch the Streamlit app with proper configuration"""
-    
-    # Get the directory where this script is located
-    app_dir = os.path.dirname(os.path.abspath(__file__))
-    app_file = os.path.join(app_dir, "streamlit_app.py")
-    
-    # Set environment variables to skip Streamlit setup
-    env = os.environ.copy()
-    env['STREAMLIT_BROWSER_GATHER_USAGE_STATS'] = 'false'
-    
-    # Streamlit command with configuration
-    cmd = [
-        sys.executable, "-m", "streamlit", "run", 
-        app_file,
-        "--server.port", "8501",
-        "--server.address", "0.0.0.0",
+# Extra flags used when this file is run directly
+_SERVER_ARGS = (
+    "--server.address", "0.0.0.0",
+    "--server.enableCORS", "false",
+    "--server.enableXsrfProtection", "false"
+)
+
+FEATURES = [
+    "🏠 Home",
+    "📁 Area of Interest",
+    "🗺️ Interactive Maps",
+    "🔍 Data Catalog",
+    "🔄 JS to Python Converter",
+    "📊 Data Analysis",
+    "📈 Visualizations",
+    "💾 Export Tools",
+    "🖼️ Publication Maps",
+    "📚 Documentation"
+]
+
+def build_command(port=8501, target="streamlit_app.py", extra_args=()):
+    """Build the streamlit argv for the given port and target script"""
+    return [
+        _PY, "-m", "streamlit", "run", target,
+        "--server.port", str(port),
         "--server.headless", "false",
         "--browser.gatherUsageStats", "false",
-        "--server.enableCORS", "false",
-        "--server.enableXsrfProtection", "false"
+        *extra_args
     ]
-    
+
+def check_app_health(port=8501, timeout_s=10):
+    """Check if the Streamlit app is responding
+
+    Probes back off exponentially from 10 ms up to 200 ms, so a fast start is
+    noticed almost immediately without flooding a slow cold start.
+    """
+    interval = 0.01
+    start = time.monotonic()
+    while time.monotonic() - start < timeout_s:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=0.5)
+        try:
+            conn.request("GET", "/")
+            if conn.getresponse().status == 200:
+                return True
+        except (OSError, http.client.HTTPException):
+            pass
+        finally:
+            conn.close()
+        time.sleep(interval)
+        interval = min(interval * 1.5, 0.2)
+    return False
+
+def _wait_for_exit(process):
+    """Keep running, waking once a second so Ctrl+C is handled promptly"""
+    while True:
+        try:
+            process.wait(timeout=1.0)
+            break
+        except subprocess.TimeoutExpired:
+            continue
+        except KeyboardInterrupt:
+            print("\n🛑 Stopping app...")
+            process.terminate()
+            process.wait(timeout=5)
+            print("✅ App stopped successfully")
+            break
+
+def _monitor(cmd, port):
+    """Run streamlit, echo its output and report whether it started cleanly"""
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+        universal_newlines=True
+    )
+
+    # Monitor output for errors, batching writes so chatty startup logs
+    # don't serialize the loop on stdout flushes
+    buf = []
+    last_flush = time.monotonic()
+
+    def flush():
+        nonlocal last_flush
+        if buf:
+            sys.stdout.write(''.join(buf))
+            sys.stdout.flush()
+            buf.clear()
+        last_flush = time.monotonic()
+
+    while True:
+        output = process.stdout.readline()
+        if output == '' and process.poll() is not None:
+            break
+        if output:
+            buf.append(f"STDOUT: {output.strip()}\n")
+
+        # Check for errors
+        error = process.stderr.readline()
+        if error:
+            buf.append(f"STDERR: {error.strip()}\n")
+
+        # Check if app started successfully
+        if "You can now view your Streamlit app in your browser" in output:
+            buf.append("\n✅ SUCCESS: App started successfully!\n")
+            buf.append(f"App should be available at: http://localhost:{port}\n")
+            break
+
+        # Check for specific error patterns
+        if "Error" in output or "Exception" in output:
+            buf.append(f"\n❌ ERROR DETECTED: {output.strip()}\n")
+
+        if len(buf) >= 16 or time.monotonic() - last_flush > 0.1:
+            flush()
+
+    flush()
+
+    # Let it run for a few seconds then terminate
+    time.sleep(3)
+    process.terminate()
+
+    return_code = process.wait()
+    print(f"\nProcess finished with return code: {return_code}")
+    return return_code
+
+def main(port=8501, target="streamlit_app.py", monitor=False, health=False, extra_args=()):
+    """Launch the Streamlit app
+
+    Args:
+        port: Port for the Streamlit server
+        target: App script, relative to APP_DIR or absolute
+        monitor: Echo streamlit's output and stop once it has started
+        health: Wait for the app to answer HTTP requests before reporting success
+        extra_args: Additional streamlit command-line flags
+
+    Returns:
+        Process exit code (0 on success)
+    """
+    os.chdir(APP_DIR)
+    cmd = build_command(port, target, extra_args)
+
     print("🚀 Starting GeoMasterPy Streamlit App...")
-    print("📍 URL: http://localhost:8501")
+    print(f"📍 URL: http://localhost:{port}")
     print("⚠️  Press Ctrl+C to stop the server")
     print("-" * 50)
-    
+
     try:
-        # Run the command with environment variables
-        subprocess.run(cmd, cwd=app_dir, env=env, check=True)
+        if monitor:
+            print(f"Command: {' '.join(cmd)}")
+            return _monitor(cmd, port)
+
+        if not health:
+            # Nothing left for the launcher to do - hand the process over
+            if os.name == "posix":
+                os.execv(_PY, cmd)
+            subprocess.run(cmd, check=True)
+            return 0
+
+        process = subprocess.Popen(cmd)
+        print(f"App starting... (PID: {process.pid})")
+
+        # Check if app is responding
+        if not check_app_health(port):
+            print("❌ ERROR: App failed to respond")
+            process.terminate()
+            process.wait(timeout=5)
+            return 1
+
+        print("✅ SUCCESS: App is running and responding!")
+        print(f"🌐 URL: http://localhost:{port}")
+        print("\n📋 App Features Available:")
+        for feature in FEATURES:
+            print(f"  {feature}")
+        print("\n" + "=" * 50)
+        print("✅ GeoMasterPy Streamlit app is working correctly!")
+        print("Press Ctrl+C to stop the app")
+
+        _wait_for_exit(process)
+
     except KeyboardInterrupt:
         print("\n👋 Shutting down GeoMasterPy app...")
     except Exception as e:
         print(f"❌ Error running app: {e}")
         return 1
-    
+
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main(extra_args=_SERVER_ARGS))
@@ -23,9 +23,12 @@ try:
     
     print("\n✅ SUCCESS! Earth Engine is authenticated!")
     
-    # Test
+    # Test - all checks share one getInfo() round-trip
     print("🧪 Testing access...")
-    image = ee.Image('LANDSAT/LC08/C02/T1_L2').first()
+    image_id = ee.ImageCollection('LANDSAT/LC08/C02/T1_L2').first().id()
+    ping, first_id = ee.List([ee.Number(1), image_id]).getInfo()
+    if ping != 1 or not first_id:
+        raise RuntimeError("Unexpected response from Earth Engine")
     print("✅ Earth Engine data access confirmed!")
     
     print("\n🎉 Your Streamlit app will now work with real Earth Engine data!")
@@ -42,10 +42,12 @@ def setup_earth_engine():
         print("\n✅ SUCCESS! Earth Engine is now authenticated")
         print("✅ Your Streamlit app will now show 'Earth Engine' as ready")
         
-        # Test with a simple query
+        # Test with a simple query - all checks share one getInfo() round-trip
         print("\n🧪 Testing Earth Engine access...")
-        image = ee.Image('LANDSAT/LC08/C02/T1_L2').first()
-        info = image.getInfo()
+        image_id = ee.ImageCollection('LANDSAT/LC08/C02/T1_L2').first().id()
+        ping, first_id = ee.List([ee.Number(1), image_id]).getInfo()
+        if ping != 1 or not first_id:
+            raise RuntimeError("Unexpected response from Earth Engine")
         print("✅ Earth Engine data access confirmed!")
         
         return True
@@ -15,64 +15,97 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Now import other modules
-import pandas as pd
-import numpy as np
+# Now import other modules (pandas/numpy are imported by the pages that use them)
 import json
+import os
 from datetime import datetime, date
-import base64
+from html import escape
 from io import BytesIO
 
-# Import with error handling - NO st.error() calls here since st.set_page_config must be first
-try:
-    import matplotlib.pyplot as plt
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-
-try:
-    import plotly.express as px
-    import plotly.graph_objects as go
-    from plotly.subplots import make_subplots
-    PLOTLY_AVAILABLE = True
-except ImportError as e:
-    PLOTLY_AVAILABLE = False
-
-try:
-    import folium
-    from streamlit_folium import st_folium
-    FOLIUM_AVAILABLE = True
-except ImportError:
-    FOLIUM_AVAILABLE = False
-
-# Import GeoMasterPy components (with fallbacks for demo mode)
-try:
-    import geomasterpy as gmp
-    GEOMASTERPY_AVAILABLE = True
-except ImportError as e:
-    GEOMASTERPY_AVAILABLE = False
-
-try:
+import importlib
+import importlib.util
+
+# Optional heavy dependencies are only probed here; each page imports what it
+# needs on first use so a cold start doesn't pay for modules it never touches.
+# NO st.error() calls here since st.set_page_config must be first
+@st.cache_resource(show_spinner=False)
+def _has_module(*names):
+    """Check whether all the named modules are installed, without importing them"""
+    return all(importlib.util.find_spec(name) is not None for name in names)
+
+MATPLOTLIB_AVAILABLE = _has_module("matplotlib")
+PLOTLY_AVAILABLE = _has_module("plotly")
+FOLIUM_AVAILABLE = _has_module("folium", "streamlit_folium")
+EE_AVAILABLE = _has_module("ee")
+CARTOPY_AVAILABLE = _has_module("cartopy")
+IPYLEAFLET_AVAILABLE = _has_module("ipyleaflet")
+PYARROW_AVAILABLE = _has_module("pyarrow")
+
+# Partial reruns need st.fragment (Streamlit 1.37+); older versions rerun the whole page
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+@st.cache_resource(show_spinner=False)
+def _rng():
+    """Shared, seeded NumPy random Generator, created on first use
+
+    The fixed seed makes a fresh server's demo data reproducible.
+    """
+    import numpy as np
+    return np.random.default_rng(0)
+
+@st.cache_resource(show_spinner=False)
+def _try_import(name):
+    """Import a module once per process on first use, returning None if it cannot be imported"""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+# geomasterpy pulls in geopandas, ipyleaflet and rasterio when imported, so being
+# installed isn't enough - it must actually import (once per process, on first run)
+GEOMASTERPY_AVAILABLE = _has_module("geomasterpy", "ee") and \
+    all(_try_import(name) is not None for name in ("geomasterpy", "ee"))
+
+# Earth Engine endpoint for programmatic, bursty request patterns like app reruns
+# and multi-zone reduceRegions. ee.Initialize is process-wide, so deployments
+# that need the standard endpoint opt out with GEOMASTERPY_EE_HIGH_VOLUME=0.
+_EE_HIGH_VOLUME_URL = 'https://earthengine-highvolume.googleapis.com'
+_EE_USE_HIGH_VOLUME = os.environ.get('GEOMASTERPY_EE_HIGH_VOLUME', '1') != '0'
+
+@st.cache_resource(show_spinner=False)
+def _init_ee():
+    """Initialize Earth Engine once per process
+
+    A failure raises, so it isn't cached and the next run tries again.
+    """
     import ee
-    EE_AVAILABLE = True
-except ImportError as e:
-    EE_AVAILABLE = False
-
-# Handle optional heavy dependencies gracefully
-try:
-    import cartopy
-    CARTOPY_AVAILABLE = True
-except ImportError:
-    CARTOPY_AVAILABLE = False
-
-try:
-    import ipyleaflet
-    IPYLEAFLET_AVAILABLE = True
-except ImportError:
-    IPYLEAFLET_AVAILABLE = False
+    if _EE_USE_HIGH_VOLUME:
+        ee.Initialize(opt_url=_EE_HIGH_VOLUME_URL)
+    else:
+        ee.Initialize()
+    return True
+
+def _get_ee_status():
+    """Earth Engine state as (ok, error message)"""
+    try:
+        _init_ee()
+        return True, None
+    except Exception as e:
+        return False, str(e)
+
+def _ensure_ee():
+    """Return the initialized ee module, raising RuntimeError if initialization failed"""
+    import ee
+    if st.session_state.get('_ee_ready'):
+        return ee
+    ok, error = _get_ee_status()
+    if not ok:
+        raise RuntimeError(error)
+    st.session_state['_ee_ready'] = True
+    return ee
 
 # Custom CSS
-st.markdown("""
+_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -90,21 +123,81 @@ st.markdown("""
         background-color: #f8f9fa;
         margin: 1rem 0;
     }
+    .status-table {
+        width: 100%;
+        border-collapse: collapse;
+    }
+    .status-table td {
+        padding: 0.25rem 0.5rem;
+        border: none;
+    }
+    .metric-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
+        gap: 1rem;
+    }
     .metric-container {
         background-color: #f0f2f6;
         padding: 1rem;
         border-radius: 10px;
         text-align: center;
     }
+    .dataset-tag {
+        background-color: #e1f5fe;
+        padding: 2px 8px;
+        border-radius: 12px;
+        font-size: 0.8em;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource(show_spinner=False)
+def _inject_css():
+    """Emit the custom CSS; Streamlit replays the cached element on reruns"""
+    st.markdown(_CSS, unsafe_allow_html=True)
+    return True
+
+_STATUS_GLYPHS = {True: "✅", False: "❌", None: "⚠️"}
+
+def _status_table_html():
+    """System status panel HTML for the current Earth Engine state"""
+    return _render_status_table(_get_ee_status() if EE_AVAILABLE else None)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _render_status_table(ee_status):
+    """Build the system status panel as one HTML table; the other rows are fixed per process"""
+    if ee_status is not None:
+        ee_ok, ee_error = ee_status
+        ee_row = ("Earth Engine", True, "") if ee_ok else ("Earth Engine", None, f"Auth needed: {escape(ee_error)}")
+    else:
+        ee_row = ("Earth Engine", None, "Optional")
+
+    status_rows = [
+        ("Plotly", PLOTLY_AVAILABLE, "" if PLOTLY_AVAILABLE else "Run: pip install plotly"),
+        ("Folium", FOLIUM_AVAILABLE, "" if FOLIUM_AVAILABLE else "Run: pip install folium streamlit-folium"),
+        ("Matplotlib", MATPLOTLIB_AVAILABLE, ""),
+        ("GeoMasterPy", GEOMASTERPY_AVAILABLE or None, "" if GEOMASTERPY_AVAILABLE else "Demo Mode"),
+        ee_row,
+        ("Streamlit", True, ""),
+        ("Pandas", True, ""),
+        ("NumPy", True, "")
+    ]
+    cells = "".join(
+        f'<tr><td>{_STATUS_GLYPHS[ok]} {name}</td><td><small>{note}</small></td></tr>'
+        for name, ok, note in status_rows
+    )
+    return f'<table class="status-table">{cells}</table>'
 
 def main():
     """Main Streamlit application"""
+    _inject_css()
     
     # Header
-    st.markdown('<h1 class="main-header">🌍 GeoMasterPy Interactive</h1>', unsafe_allow_html=True)
-    st.markdown("**Interactive Geospatial Analysis with Google Earth Engine**")
+    st.markdown(
+        '<h1 class="main-header">🌍 GeoMasterPy Interactive</h1>\n\n'
+        '**Interactive Geospatial Analysis with Google Earth Engine**',
+        unsafe_allow_html=True
+    )
     
     # Show requirements info
     if not PLOTLY_AVAILABLE or not FOLIUM_AVAILABLE:
@@ -125,101 +218,20 @@ requirements_minimal.txt
     
     # Check system status
     with st.expander("🔧 System Status", expanded=True):
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            if PLOTLY_AVAILABLE:
-                st.success("✅ Plotly")
-            else:
-                st.error("❌ Plotly Missing")
-                st.caption("Run: pip install plotly")
-        
-        with col2:
-            if FOLIUM_AVAILABLE:
-                st.success("✅ Folium")
-            else:
-                st.error("❌ Folium Missing")
-                st.caption("Run: pip install folium streamlit-folium")
-        
-        with col3:
-            if MATPLOTLIB_AVAILABLE:
-                st.success("✅ Matplotlib")
-            else:
-                st.error("❌ Matplotlib Missing")
-        
-        with col4:
-            if GEOMASTERPY_AVAILABLE:
-                st.success("✅ GeoMasterPy")
-            else:
-                st.warning("⚠️ Demo Mode")
-        
-        # Second row for additional status
-        col5, col6, col7, col8 = st.columns(4)
-        
-        with col5:
-            if EE_AVAILABLE:
-                try:
-                    ee.Initialize()
-                    st.success("✅ Earth Engine")
-                    ee_status = True
-                except:
-                    st.warning("⚠️ EE Auth Needed")
-                    ee_status = False
-            else:
-                st.info("ℹ️ EE Optional")
-                ee_status = False
-        
-        with col6:
-            st.success("✅ Streamlit")
-        
-        with col7:
-            st.success("✅ Pandas")
-        
-        with col8:
-            st.success("✅ NumPy")
+        st.markdown(_status_table_html(), unsafe_allow_html=True)
     
     # Sidebar navigation
     st.sidebar.title("🧭 Navigation")
-    page = st.sidebar.selectbox(
-        "Choose a feature:",
-        [
-            "🏠 Home",
-            "🌍 Land App (New!)",
-            "📁 Area of Interest",
-            "🗺️ Interactive Maps", 
-            "🔍 Data Catalog",
-            "🔄 JS to Python Converter",
-            "📊 Data Analysis",
-            "📈 Visualizations",
-            "💾 Export Tools",
-            "🖼️ Publication Maps",
-            "📚 Documentation"
-        ]
-    )
+    page = st.sidebar.selectbox("Choose a feature:", list(PAGES))
     
-    # Route to different pages
-    if page == "🏠 Home":
-        show_home()
-    elif page == "🌍 Land App (New!)":
-        show_land_app()
-    elif page == "📁 Area of Interest":
-        show_area_of_interest()
-    elif page == "🗺️ Interactive Maps":
-        show_interactive_maps()
-    elif page == "🔍 Data Catalog":
-        show_data_catalog()
-    elif page == "🔄 JS to Python Converter":
-        show_js_converter()
-    elif page == "📊 Data Analysis":
-        show_data_analysis()
-    elif page == "📈 Visualizations":
-        show_visualizations()
-    elif page == "💾 Export Tools":
-        show_export_tools()
-    elif page == "🖼️ Publication Maps":
-        show_publication_maps()
-    elif page == "📚 Documentation":
-        show_documentation()
+    # Route to the selected page
+    PAGES[page]()
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _load_land_app_html(path: str, mtime: float) -> str:
+    """Read the Land App HTML once per file version; mtime is part of the key so edits invalidate it"""
+    from pathlib import Path
+    return Path(path).read_text(encoding="utf-8")
 
 def show_land_app():
     """Display the Land App interface"""
@@ -247,11 +259,10 @@ def show_land_app():
         """)
     
     with col2:
-        st.markdown("### 🎯 Quick Access")
+        # Heading and launch hints in one element
+        st.markdown("""
+        ### 🎯 Quick Access
         
-        # Direct link to standalone Land App
-        land_app_url = "streamlit_land_app.py"
-        st.markdown(f"""
         **🌍 Standalone Land App:**  
         Run: `streamlit run streamlit_land_app.py`
         
@@ -276,11 +287,10 @@ def show_land_app():
     land_app_path = Path(__file__).parent / "src" / "web" / "land-app-ui-mockup.html"
     
     if land_app_path.exists():
-        # Read the HTML file
-        with open(land_app_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        # Read the HTML file (cached until it changes on disk)
+        html_content = _load_land_app_html(str(land_app_path), land_app_path.stat().st_mtime)
         
-        # Display the HTML content in an iframe-style container
+        # Display the HTML content
         st.components.v1.html(html_content, height=600, scrolling=True)
         
         # Download option
@@ -297,71 +307,55 @@ def show_land_app():
         st.error("Land App HTML file not found.")
         st.info("Expected location: src/web/land-app-ui-mockup.html")
 
+# Home page quick stats and feature list
+_HOME_METRICS = [
+    ("🗺️", "Interactive Maps", "Create dynamic maps with Earth Engine"),
+    ("📊", "Data Analysis", "Powerful geospatial analytics"),
+    ("🎨", "Visualizations", "Beautiful charts and maps"),
+    ("💾", "Export Tools", "Save your results anywhere")
+]
+
+_HOME_FEATURES = [
+    ("🗺️ Interactive Mapping", "Create dynamic maps with Google Earth Engine integration"),
+    ("🔍 Data Catalog Search", "Discover and explore Earth Engine datasets"),
+    ("🔄 JavaScript Converter", "Convert GEE JavaScript code to Python"),
+    ("📊 Geospatial Analysis", "Perform statistical analysis and classification"),
+    ("📈 Advanced Visualizations", "Create charts, legends, and animations"),
+    ("💾 Data Export", "Export images and data to multiple formats"),
+    ("🖼️ Publication Maps", "Generate high-quality static maps"),
+    ("📚 Comprehensive Docs", "Complete documentation and examples")
+]
+
+@st.cache_resource(show_spinner=False)
+def _home_html():
+    """(metric cards, feature boxes) HTML for the home page, joined once per process
+
+    The main script re-runs on every interaction, so module-level joins
+    would be redone each time.
+    """
+    metrics_html = '<div class="metric-grid">' + "".join(
+        f'<div class="metric-container"><h3>{icon}</h3><p><strong>{title}</strong></p><p>{description}</p></div>'
+        for icon, title, description in _HOME_METRICS
+    ) + '</div>'
+    features_html = "".join(
+        f'<div class="feature-box"><h4>{title}</h4><p>{description}</p></div>'
+        for title, description in _HOME_FEATURES
+    )
+    return metrics_html, features_html
+
 def show_home():
     """Home page with overview and quick start"""
     
     st.markdown("## Welcome to GeoMasterPy! 🚀")
     
-    # Quick stats
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown("""
-        <div class="metric-container">
-            <h3>🗺️</h3>
-            <p><strong>Interactive Maps</strong></p>
-            <p>Create dynamic maps with Earth Engine</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="metric-container">
-            <h3>📊</h3>
-            <p><strong>Data Analysis</strong></p>
-            <p>Powerful geospatial analytics</p>
-        </div>
-        """, unsafe_allow_html=True)
+    metrics_html, features_html = _home_html()
     
-    with col3:
-        st.markdown("""
-        <div class="metric-container">
-            <h3>🎨</h3>
-            <p><strong>Visualizations</strong></p>
-            <p>Beautiful charts and maps</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="metric-container">
-            <h3>💾</h3>
-            <p><strong>Export Tools</strong></p>
-            <p>Save your results anywhere</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # Quick stats
+    st.markdown(metrics_html, unsafe_allow_html=True)
     
     # Features overview
     st.markdown("## 🌟 Key Features")
-    
-    features = [
-        ("🗺️ Interactive Mapping", "Create dynamic maps with Google Earth Engine integration"),
-        ("🔍 Data Catalog Search", "Discover and explore Earth Engine datasets"),
-        ("🔄 JavaScript Converter", "Convert GEE JavaScript code to Python"),
-        ("📊 Geospatial Analysis", "Perform statistical analysis and classification"),
-        ("📈 Advanced Visualizations", "Create charts, legends, and animations"),
-        ("💾 Data Export", "Export images and data to multiple formats"),
-        ("🖼️ Publication Maps", "Generate high-quality static maps"),
-        ("📚 Comprehensive Docs", "Complete documentation and examples")
-    ]
-    
-    for title, description in features:
-        st.markdown(f"""
-        <div class="feature-box">
-            <h4>{title}</h4>
-            <p>{description}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(features_html, unsafe_allow_html=True)
     
     # Quick start
     st.markdown("## 🚀 Quick Start")
@@ -369,8 +363,9 @@ def show_home():
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("### For Beginners")
         st.markdown("""
+        ### For Beginners
+        
         1. 📁 Define your **Area of Interest** from Google Drive
         2. 🔍 Start with **Data Catalog** to explore datasets
         3. 🗺️ Create your first **Interactive Map**
@@ -378,14 +373,103 @@ def show_home():
         """)
     
     with col2:
-        st.markdown("### For Advanced Users")
         st.markdown("""
+        ### For Advanced Users
+        
         1. 📁 Upload **Area of Interest** boundary from Google Drive
         2. 📊 Jump to **Data Analysis** for complex workflows
         3. 🖼️ Create **Publication Maps** for research
         4. 💾 Use **Export Tools** for data management
         """)
 
+# Largest raw GeoJSON shown in full; bigger payloads get a truncated preview
+_RAW_GEOJSON_PREVIEW_CHARS = 4096
+
+@st.cache_data(ttl=86400, max_entries=128, show_spinner=False)
+def _load_and_validate(url: str):
+    """Validate a Google Drive URL and download its GeoJSON, shared across sessions
+
+    Returns None for an invalid URL. A failed download raises ValueError so
+    that it is retried next time instead of being cached.
+    """
+    from geomasterpy.data.catalog import validate_drive_url, load_geojson_from_drive_url
+    if not validate_drive_url(url):
+        return None
+    geojson_data = load_geojson_from_drive_url(url)
+    if geojson_data is None:
+        raise ValueError("GeoJSON could not be loaded")
+    return geojson_data
+
+@st.cache_resource(show_spinner=False)
+def _to_ee_geometry(geojson_str: str):
+    """Convert a GeoJSON (serialized with sorted keys) to an ee.Geometry once
+
+    A failed conversion raises ValueError so it isn't cached - Earth Engine
+    may not be initialized yet.
+    """
+    from geomasterpy.data.catalog import geojson_to_ee_geometry
+    geometry = geojson_to_ee_geometry(json.loads(geojson_str))
+    if geometry is None:
+        raise ValueError("GeoJSON could not be converted to an Earth Engine geometry")
+    return geometry
+
+def _aoi_key():
+    """Sorted-key JSON of the current AOI, serialized once per load and reused as a cache key"""
+    key = st.session_state.get('aoi_geojson_key')
+    if key is None and st.session_state.get('aoi_geojson'):
+        key = st.session_state.aoi_geojson_key = json.dumps(st.session_state.aoi_geojson, sort_keys=True)
+    return key
+
+def _flat_coords(geojson):
+    """Yield an (N, 2) lon/lat array for each leaf coordinate sequence in a GeoJSON"""
+    import numpy as np
+    stack = [geojson]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            stack.extend(obj.get('features') or [])
+            stack.extend(obj.get('geometries') or [])
+            for key in ('geometry', 'coordinates'):
+                if obj.get(key) is not None:
+                    stack.append(obj[key])
+        elif not obj:
+            continue
+        elif isinstance(obj[0], (int, float)):
+            # Single position (Point)
+            yield np.asarray(obj[:2], dtype=np.float64).reshape(1, 2)
+        elif obj[0] and isinstance(obj[0][0], (int, float)):
+            # Ring / line: one array per sequence, dropping any elevation
+            yield np.asarray(obj, dtype=np.float64)[:, :2]
+        else:
+            stack.extend(obj)
+
+def _bounds_of(geojson):
+    """Return [[south, west], [north, east]] for a GeoJSON via one vectorized min/max"""
+    import numpy as np
+    lonlat = np.concatenate(list(_flat_coords(geojson)), axis=0)
+    west, south = lonlat.min(axis=0)
+    east, north = lonlat.max(axis=0)
+    return [[float(south), float(west)], [float(north), float(east)]]
+
+@st.cache_data(show_spinner=False)
+def _render_aoi_map_html(geojson_str: str) -> str:
+    """Render the AOI preview map to a standalone HTML document"""
+    import folium
+    
+    geojson_data = json.loads(geojson_str)
+    m = folium.Map()
+    folium.GeoJson(
+        geojson_data,
+        style_function=lambda x: {
+            'fillColor': 'red',
+            'color': 'red',
+            'weight': 2,
+            'fillOpacity': 0.3
+        }
+    ).add_to(m)
+    m.fit_bounds(_bounds_of(geojson_data))
+    return m.get_root().render()
+
 def show_area_of_interest():
     """Area of Interest definition interface with Google Drive GeoJSON support"""
     
@@ -450,29 +534,30 @@ def show_area_of_interest():
                         if not GEOMASTERPY_AVAILABLE:
                             st.error("GeoMasterPy not available. Please check installation.")
                         else:
-                            # Import the functions
-                            from geomasterpy.data.catalog import (
-                                validate_drive_url, 
-                                load_geojson_from_drive_url,
-                                geojson_to_ee_geometry
-                            )
+                            # Validate and load (cached per URL across sessions)
+                            try:
+                                geojson_data = _load_and_validate(drive_url)
+                                url_valid = geojson_data is not None
+                            except ValueError:
+                                geojson_data = None
+                                url_valid = True
                             
-                            # Validate URL
-                            if not validate_drive_url(drive_url):
+                            if not url_valid:
                                 st.error("Invalid Google Drive URL. Please check the format.")
                             else:
-                                # Load GeoJSON
-                                geojson_data = load_geojson_from_drive_url(drive_url)
-                                
                                 if geojson_data:
                                     # Store in session state
                                     st.session_state.aoi_geojson = geojson_data
+                                    st.session_state.aoi_geojson_key = json.dumps(geojson_data, sort_keys=True)
                                     st.session_state.aoi_name = aoi_name if aoi_name else "Custom Area"
                                     
                                     # Convert to Earth Engine geometry if EE is available
                                     if EE_AVAILABLE:
-                                        ee_geometry = geojson_to_ee_geometry(geojson_data)
-                                        st.session_state.aoi_geometry = ee_geometry
+                                        try:
+                                            st.session_state.aoi_geometry = _to_ee_geometry(st.session_state.aoi_geojson_key)
+                                        except ValueError as e:
+                                            st.session_state.aoi_geometry = None
+                                            st.warning(f"⚠️ {e}. Earth Engine analysis needs authentication.")
                                     
                                     st.success(f"✅ Successfully loaded GeoJSON: {st.session_state.aoi_name}")
                                     
@@ -488,6 +573,7 @@ def show_area_of_interest():
         if st.button("🗑️ Clear Area"):
             st.session_state.aoi_geometry = None
             st.session_state.aoi_geojson = None
+            st.session_state.aoi_geojson_key = None
             st.session_state.aoi_name = "Custom Area"
             st.success("Area of interest cleared")
     
@@ -523,45 +609,21 @@ def show_area_of_interest():
             st.markdown("### 🌍 Area Preview")
             
             try:
-                import folium
-                import json
-                
-                # Create a simple folium map
-                # Calculate bounds from GeoJSON
-                if st.session_state.aoi_geojson['type'] == 'FeatureCollection':
-                    # Get first feature's coordinates for centering
-                    first_feature = st.session_state.aoi_geojson['features'][0]
-                    coords = first_feature['geometry']['coordinates']
-                else:
-                    coords = st.session_state.aoi_geojson['coordinates']
-                
-                # Create map centered on the area
-                m = folium.Map(location=[0, 0], zoom_start=2)
-                
-                # Add GeoJSON to map
-                folium.GeoJson(
-                    st.session_state.aoi_geojson,
-                    style_function=lambda x: {
-                        'fillColor': 'red',
-                        'color': 'red',
-                        'weight': 2,
-                        'fillOpacity': 0.3
-                    }
-                ).add_to(m)
-                
-                # Fit bounds to the geometry
-                geojson_layer = folium.GeoJson(st.session_state.aoi_geojson)
-                m.fit_bounds(geojson_layer.get_bounds())
-                
-                # Display map
-                st_folium(m, width=700, height=400)
+                # Static preview - no widget state needed, so skip st_folium
+                html = _render_aoi_map_html(_aoi_key())
+                st.components.v1.html(html, height=400)
                 
             except Exception as e:
                 st.warning(f"Could not display map preview: {str(e)}")
         
-        # Raw GeoJSON viewer (optional)
-        with st.expander("🔍 View Raw GeoJSON", expanded=False):
-            st.json(st.session_state.aoi_geojson)
+        # Raw GeoJSON viewer (optional) - only sent to the browser when asked for
+        if st.checkbox("🔍 View Raw GeoJSON", value=False):
+            raw = json.dumps(st.session_state.aoi_geojson, indent=2)
+            if len(raw) > _RAW_GEOJSON_PREVIEW_CHARS:
+                st.caption(f"Showing the first {_RAW_GEOJSON_PREVIEW_CHARS:,} of {len(raw):,} characters")
+                st.code(raw[:_RAW_GEOJSON_PREVIEW_CHARS] + "\n...", language="json")
+            else:
+                st.json(st.session_state.aoi_geojson)
     
     else:
         st.markdown("### 📍 No Area of Interest Defined")
@@ -581,9 +643,82 @@ def show_area_of_interest():
         All analysis tools will automatically use your defined area as the region of interest.
         """)
 
+# Code example shown under the interactive map
+_MAP_SNIPPET = """import geomasterpy as gmp
+import ee
+
+# Initialize Earth Engine
+ee.Initialize()
+
+# Create interactive map
+Map = gmp.Map(center=({lat}, {lon}), zoom={zoom})
+
+# Add basemap
+Map.add_basemap('{basemap}')
+
+# Load satellite data
+landsat = ee.ImageCollection('LANDSAT/LC08/C02/T1_L2') \\
+    .filterBounds(ee.Geometry.Point({lon}, {lat})) \\
+    .filterDate('2023-01-01', '2023-12-31') \\
+    .filter(ee.Filter.lt('CLOUD_COVER', 20)) \\
+    .median()
+
+# Add to map
+vis_params = {{
+    'bands': ['SR_B4', 'SR_B3', 'SR_B2'],
+    'min': 0.0,
+    'max': 0.3,
+    'gamma': 1.4
+}}
+
+Map.add_ee_layer(landsat, vis_params, 'Landsat 8')
+
+# Display map
+Map
+"""
+
+def _map_snippet(lat, lon, zoom, basemap):
+    """Fill in the map code example for the current settings"""
+    return _MAP_SNIPPET.format(lat=lat, lon=lon, zoom=zoom, basemap=basemap)
+
+# Preset map centres (lat, lon)
+_MAP_LOCATIONS = {
+    "San Francisco, CA": (37.7749, -122.4194),
+    "New York, NY": (40.7128, -74.0060),
+    "Yellowstone National Park": (44.4280, -110.5885),
+    "Amazon Rainforest": (-3.4653, -62.2159)
+}
+
+# Basemap choice -> folium tiles name
+_FOLIUM_TILES = {
+    "OpenStreetMap": "OpenStreetMap",
+    "CartoDB Positron": "CartoDB positron",
+    "CartoDB Dark Matter": "CartoDB dark_matter",
+    "Stamen Terrain": "Stamen Terrain",
+    "Stamen Toner": "Stamen Toner"
+}
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _make_folium_map(lat, lon, zoom, tiles, label):
+    """Folium map centred on a location with a labelled marker"""
+    import folium
+    m = folium.Map(location=[lat, lon], zoom_start=zoom, tiles=tiles)
+    folium.Marker(
+        [lat, lon],
+        popup=folium.Popup(f"📍 {label}", max_width=200),
+        tooltip="Click for info"
+    ).add_to(m)
+    return m
+
 def show_interactive_maps():
     """Interactive mapping interface"""
     
+    try:
+        from streamlit_folium import st_folium
+    except ImportError:
+        st.error("❌ Interactive maps need Folium. Run: pip install folium streamlit-folium")
+        return
+    
     st.markdown("## 🗺️ Interactive Maps")
     
     # Map configuration
@@ -595,30 +730,17 @@ def show_interactive_maps():
         # Location selector
         location = st.selectbox(
             "Choose a location:",
-            [
-                "San Francisco, CA",
-                "New York, NY", 
-                "Yellowstone National Park",
-                "Amazon Rainforest",
-                "Custom Location"
-            ]
+            [*_MAP_LOCATIONS, "Custom Location"],
+            key="map_location"
         )
         
-        # Location coordinates
-        locations = {
-            "San Francisco, CA": (37.7749, -122.4194),
-            "New York, NY": (40.7128, -74.0060),
-            "Yellowstone National Park": (44.4280, -110.5885),
-            "Amazon Rainforest": (-3.4653, -62.2159),
-        }
-        
         if location == "Custom Location":
-            lat = st.number_input("Latitude", value=37.7749, format="%.4f")
-            lon = st.number_input("Longitude", value=-122.4194, format="%.4f")
+            lat = st.number_input("Latitude", value=37.7749, format="%.4f", key="map_lat")
+            lon = st.number_input("Longitude", value=-122.4194, format="%.4f", key="map_lon")
         else:
-            lat, lon = locations[location]
+            lat, lon = _MAP_LOCATIONS[location]
         
-        zoom = st.slider("Zoom Level", 1, 18, 10)
+        zoom = st.slider("Zoom Level", 1, 18, 10, key="map_zoom")
         
         # Basemap selection
         basemap = st.selectbox(
@@ -629,39 +751,18 @@ def show_interactive_maps():
                 "CartoDB Dark Matter", 
                 "Stamen Terrain",
                 "Stamen Toner"
-            ]
+            ],
+            key="map_basemap"
         )
     
     with col2:
         st.markdown("### Interactive Map")
         
-        # Create folium map
-        if basemap == "OpenStreetMap":
-            tiles = "OpenStreetMap"
-        elif basemap == "CartoDB Positron":
-            tiles = "CartoDB positron"
-        elif basemap == "CartoDB Dark Matter":
-            tiles = "CartoDB dark_matter"
-        elif basemap == "Stamen Terrain":
-            tiles = "Stamen Terrain"
-        else:
-            tiles = "Stamen Toner"
-        
-        m = folium.Map(
-            location=[lat, lon],
-            zoom_start=zoom,
-            tiles=tiles
-        )
+        # Create folium map (reused while the settings are unchanged)
+        m = _make_folium_map(lat, lon, zoom, _FOLIUM_TILES[basemap], location)
         
-        # Add marker
-        folium.Marker(
-            [lat, lon],
-            popup=f"📍 {location}",
-            tooltip="Click for info"
-        ).add_to(m)
-        
-        # Display map
-        map_data = st_folium(m, width=700, height=500)
+        # Display map - nothing is read back, so panning and zooming don't rerun the app
+        st_folium(m, width=700, height=500, returned_objects=[], key="main_map")
     
     # Earth Engine data options (demo mode)
     st.markdown("### 🛰️ Satellite Data Options")
@@ -682,39 +783,48 @@ def show_interactive_maps():
     
     # Code example
     with st.expander("💻 Code Example"):
-        st.code("""
-import geomasterpy as gmp
-import ee
-
-# Initialize Earth Engine
-ee.Initialize()
-
-# Create interactive map
-Map = gmp.Map(center=({lat}, {lon}), zoom={zoom})
-
-# Add basemap
-Map.add_basemap('{basemap}')
-
-# Load satellite data
-landsat = ee.ImageCollection('LANDSAT/LC08/C02/T1_L2') \\
-    .filterBounds(ee.Geometry.Point({lon}, {lat})) \\
-    .filterDate('2023-01-01', '2023-12-31') \\
-    .filter(ee.Filter.lt('CLOUD_COVER', 20)) \\
-    .median()
-
-# Add to map
-vis_params = {{
-    'bands': ['SR_B4', 'SR_B3', 'SR_B2'],
-    'min': 0.0,
-    'max': 0.3,
-    'gamma': 1.4
-}}
+        st.code(_map_snippet(lat, lon, zoom, basemap))
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _search_catalog(term: str, n: int):
+    """Search the Earth Engine catalog, reusing identical queries for an hour
+
+    Earth Engine is checked first: search_ee_data returns [] when it isn't
+    initialized, and that empty result must not be cached for the hour.
+    """
+    _ensure_ee()
+    return _try_import("geomasterpy").search_ee_data(term, n)
+
+# Well-known datasets by category for the catalog page: (name, asset id)
+_POPULAR_DATASETS = {
+    "🛰️ Optical Imagery": [
+        ("Landsat 8 Level-2", "LANDSAT/LC08/C02/T1_L2"),
+        ("Sentinel-2 Level-2A", "COPERNICUS/S2_SR_HARMONIZED"),
+        ("MODIS Terra Surface Reflectance", "MODIS/061/MOD09A1")
+    ],
+    "🌡️ Climate Data": [
+        ("ERA5-Land Hourly", "ECMWF/ERA5_LAND/HOURLY"),
+        ("CHIRPS Daily Precipitation", "UCSB-CHG/CHIRPS/DAILY"),
+        ("MODIS Land Surface Temperature", "MODIS/061/MOD11A1")
+    ],
+    "🏔️ Elevation & Terrain": [
+        ("NASA SRTM DEM", "USGS/SRTMGL1_003"),
+        ("NASA DEM", "NASA/NASADEM_HGT/001"),
+        ("ALOS World 3D", "JAXA/ALOS/AW3D30/V3_2")
+    ]
+}
 
-Map.add_ee_layer(landsat, vis_params, 'Landsat 8')
+# Catalog result tag; styled by .dataset-tag in _CSS
+_TAG_TMPL = '<span class="dataset-tag">{}</span>'
 
-# Display map
-Map
-        """.format(lat=lat, lon=lon, zoom=zoom, basemap=basemap))
+def _result_markdown(result, tags=True):
+    """Markdown summary of one catalog search result"""
+    text = (f"**Dataset ID:** `{result['id']}`\n\n"
+            f"**Description:** {result['description']}\n\n"
+            f"**Provider:** {result['provider']}")
+    if tags and 'tags' in result:
+        text += "\n\n**Tags:** " + " ".join(_TAG_TMPL.format(tag) for tag in result['tags'])
+    return text
 
 def show_data_catalog():
     """Data catalog and search interface"""
@@ -735,10 +845,11 @@ def show_data_catalog():
         max_results = st.number_input("Max results:", 1, 50, 10)
     
     if st.button("🔍 Search Datasets"):
-        if GEOMASTERPY_AVAILABLE:
+        gmp = _try_import("geomasterpy") if GEOMASTERPY_AVAILABLE else None
+        if gmp is not None:
             with st.spinner("Searching Earth Engine catalog..."):
                 try:
-                    results = gmp.search_ee_data(search_term, max_results)
+                    results = _search_catalog(search_term, max_results)
                     
                     if results:
                         st.success(f"Found {len(results)} datasets matching '{search_term}'")
@@ -749,19 +860,13 @@ def show_data_catalog():
                                 col1, col2 = st.columns([2, 1])
                                 
                                 with col1:
-                                    st.markdown(f"**Dataset ID:** `{result['id']}`")
-                                    st.markdown(f"**Description:** {result['description']}")
-                                    st.markdown(f"**Provider:** {result['provider']}")
-                                    
-                                    # Tags
-                                    if 'tags' in result:
-                                        tags_html = " ".join([f'<span style="background-color: #e1f5fe; padding: 2px 8px; border-radius: 12px; font-size: 0.8em;">{tag}</span>' for tag in result['tags']])
-                                        st.markdown(f"**Tags:** {tags_html}", unsafe_allow_html=True)
+                                    # ID, description, provider and tags in one element
+                                    st.markdown(_result_markdown(result), unsafe_allow_html='tags' in result)
                                 
                                 with col2:
                                     st.code(f"ee.ImageCollection('{result['id']}')")
-                                    if st.button(f"📋 Copy ID", key=f"copy_{i}"):
-                                        st.info(f"Copy this: {result['id']}")
+                                    # st.code has a built-in clientside copy button
+                                    st.code(result['id'], language=None)
                     else:
                         st.warning(f"No datasets found for '{search_term}'. Try terms like 'landsat', 'sentinel', 'modis'.")
                         
@@ -790,55 +895,20 @@ def show_data_catalog():
             
             for i, result in enumerate(sample_results, 1):
                 with st.expander(f"📊 {i}. {result['title']}"):
-                    st.markdown(f"**Dataset ID:** `{result['id']}`")
-                    st.markdown(f"**Description:** {result['description']}")
-                    st.markdown(f"**Provider:** {result['provider']}")
+                    st.markdown(_result_markdown(result, tags=False))
     
     # Popular datasets
     st.markdown("## 🌟 Popular Datasets")
     
-    popular_datasets = {
-        "🛰️ Optical Imagery": [
-            ("Landsat 8 Level-2", "LANDSAT/LC08/C02/T1_L2"),
-            ("Sentinel-2 Level-2A", "COPERNICUS/S2_SR_HARMONIZED"),
-            ("MODIS Terra Surface Reflectance", "MODIS/061/MOD09A1")
-        ],
-        "🌡️ Climate Data": [
-            ("ERA5-Land Hourly", "ECMWF/ERA5_LAND/HOURLY"),
-            ("CHIRPS Daily Precipitation", "UCSB-CHG/CHIRPS/DAILY"),
-            ("MODIS Land Surface Temperature", "MODIS/061/MOD11A1")
-        ],
-        "🏔️ Elevation & Terrain": [
-            ("NASA SRTM DEM", "USGS/SRTMGL1_003"),
-            ("NASA DEM", "NASA/NASADEM_HGT/001"),
-            ("ALOS World 3D", "JAXA/ALOS/AW3D30/V3_2")
-        ]
-    }
-    
-    for category, datasets in popular_datasets.items():
+    for category, datasets in _POPULAR_DATASETS.items():
         with st.expander(category):
+            # Copy via the code block's own clipboard button - no widget per row
             for name, dataset_id in datasets:
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.markdown(f"**{name}**")
-                    st.code(dataset_id)
-                with col2:
-                    if st.button("📋", key=f"copy_{dataset_id}"):
-                        st.info("Copied!")
+                st.markdown(f"**{name}**")
+                st.code(dataset_id, language=None)
 
-def show_js_converter():
-    """JavaScript to Python converter"""
-    
-    st.markdown("## 🔄 JavaScript to Python Converter")
-    st.markdown("Convert your Google Earth Engine JavaScript code to Python instantly!")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("### 📝 JavaScript Code")
-        
-        # Sample JavaScript code
-        sample_js = """// Load a Landsat 8 image
+# Sample JavaScript code for the converter, and its conversion for demo mode
+_JS_SAMPLE = """// Load a Landsat 8 image
 var image = ee.Image('LANDSAT/LC08/C02/T1_L2/LC08_044034_20140318');
 
 // Calculate NDVI
@@ -854,10 +924,65 @@ Map.addLayer(ndvi, {
 // Print image info
 print('Image info:', image);
 Map.centerObject(image, 9);"""
+
+_JS_DEMO_PYTHON = """import ee
+ee.Initialize()
+
+# Load a Landsat 8 image
+image = ee.Image('LANDSAT/LC08/C02/T1_L2/LC08_044034_20140318')
+
+# Calculate NDVI
+ndvi = image.normalizedDifference(['SR_B5', 'SR_B4'])
+
+# Add to map
+Map.add_ee_layer(ndvi, {
+    'min': -1,
+    'max': 1,
+    'palette': ['blue', 'white', 'green']
+}, 'NDVI')
+
+# Print image info
+print('Image info:', image)
+Map.center_object(image, 9)"""
+
+# JS -> Python conversion tips for the converter page
+_JS_TIPS = [
+    ("Variables", "`var x = ...` → `x = ...`"),
+    ("Print statements", "`print(...)` → `print(...)`"),
+    ("Map methods", "`Map.addLayer(...)` → `Map.add_ee_layer(...)`"),
+    ("Boolean values", "`true/false` → `True/False`"),
+    ("Comments", "`// comment` → `# comment`"),
+    ("Earth Engine", "`ee.Image(...)` → `ee.Image(...)`")
+]
+
+@st.cache_resource(show_spinner=False)
+def _js_tips_md():
+    """The tips as markdown for the page's two columns, joined once per process"""
+    return tuple(
+        "\n\n".join(f"**{concept}:** `{conversion}`" for concept, conversion in _JS_TIPS[start::2])
+        for start in (0, 1)
+    )
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _js_to_py(js_code: str) -> str:
+    """Convert a JavaScript snippet to Python, reusing earlier conversions"""
+    return _try_import("geomasterpy").js_snippet_to_python(js_code)
+
+def show_js_converter():
+    """JavaScript to Python converter"""
+    
+    st.markdown("## 🔄 JavaScript to Python Converter")
+    st.markdown("Convert your Google Earth Engine JavaScript code to Python instantly!")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 📝 JavaScript Code")
+        
         
         js_code = st.text_area(
             "Paste your JavaScript code here:",
-            value=sample_js,
+            value=_JS_SAMPLE,
             height=400,
             help="Enter Google Earth Engine JavaScript code"
         )
@@ -866,59 +991,36 @@ Map.centerObject(image, 9);"""
         st.markdown("### 🐍 Python Code")
         
         if st.button("🔄 Convert to Python"):
-            if GEOMASTERPY_AVAILABLE:
+            gmp = _try_import("geomasterpy") if GEOMASTERPY_AVAILABLE else None
+            if gmp is not None:
                 try:
-                    python_code = gmp.js_snippet_to_python(js_code)
+                    python_code = _js_to_py(js_code)
                     st.code(python_code, language='python')
                     
                     # Download button
-                    b64 = base64.b64encode(python_code.encode()).decode()
-                    href = f'<a href="data:file/txt;base64,{b64}" download="converted_code.py">💾 Download Python Code</a>'
-                    st.markdown(href, unsafe_allow_html=True)
+                    st.download_button(
+                        "💾 Download Python Code",
+                        data=python_code,
+                        file_name="converted_code.py",
+                        mime="text/x-python"
+                    )
                     
                 except Exception as e:
                     st.error(f"Conversion error: {str(e)}")
             else:
                 # Demo conversion
-                demo_python = """import ee
-ee.Initialize()
-
-# Load a Landsat 8 image
-image = ee.Image('LANDSAT/LC08/C02/T1_L2/LC08_044034_20140318')
-
-# Calculate NDVI
-ndvi = image.normalizedDifference(['SR_B5', 'SR_B4'])
-
-# Add to map
-Map.add_ee_layer(ndvi, {
-    'min': -1,
-    'max': 1,
-    'palette': ['blue', 'white', 'green']
-}, 'NDVI')
-
-# Print image info
-print('Image info:', image)
-Map.center_object(image, 9)"""
-                st.code(demo_python, language='python')
+                st.code(_JS_DEMO_PYTHON, language='python')
         else:
             st.info("👆 Click 'Convert to Python' to see the converted code")
     
     # Conversion tips
     st.markdown("## 💡 Conversion Tips")
     
-    tips = [
-        ("Variables", "`var x = ...` → `x = ...`"),
-        ("Print statements", "`print(...)` → `print(...)`"),
-        ("Map methods", "`Map.addLayer(...)` → `Map.add_ee_layer(...)`"),
-        ("Boolean values", "`true/false` → `True/False`"),
-        ("Comments", "`// comment` → `# comment`"),
-        ("Earth Engine", "`ee.Image(...)` → `ee.Image(...)`")
-    ]
-    
+    # One markdown block per column, in the same left/right order as before
     col1, col2 = st.columns(2)
-    for i, (concept, conversion) in enumerate(tips):
-        with col1 if i % 2 == 0 else col2:
-            st.markdown(f"**{concept}:** `{conversion}`")
+    left_tips, right_tips = _js_tips_md()
+    col1.markdown(left_tips)
+    col2.markdown(right_tips)
 
 def show_data_analysis():
     """Data analysis and statistics interface"""
@@ -940,31 +1042,123 @@ def show_data_analysis():
     st.markdown("---")
     
     # Analysis type selector
-    analysis_type = st.selectbox(
-        "Choose analysis type:",
-        [
-            "📈 Image Statistics",
-            "🎯 Zonal Statistics", 
-            "🔢 Spectral Indices",
-            "🏷️ Image Classification",
-            "🔍 Change Detection"
-        ]
+    analysis_type = st.selectbox("Choose analysis type:", list(ANALYSIS_TOOLS))
+    ANALYSIS_TOOLS[analysis_type]()
+
+# Collection and band names for each dataset offered by the statistics page
+_STATS_DATASETS = {
+    "Landsat 8": ('LANDSAT/LC08/C02/T1_L2', {
+        'Blue': 'SR_B2', 'Green': 'SR_B3', 'Red': 'SR_B4',
+        'NIR': 'SR_B5', 'SWIR1': 'SR_B6', 'SWIR2': 'SR_B7'
+    }),
+    "Sentinel-2": ('COPERNICUS/S2_SR_HARMONIZED', {
+        'Blue': 'B2', 'Green': 'B3', 'Red': 'B4',
+        'NIR': 'B8', 'SWIR1': 'B11', 'SWIR2': 'B12'
+    }),
+    "MODIS": ('MODIS/061/MOD09A1', {
+        'Red': 'sur_refl_b01', 'NIR': 'sur_refl_b02',
+        'Blue': 'sur_refl_b03', 'Green': 'sur_refl_b04',
+        'SWIR1': 'sur_refl_b06', 'SWIR2': 'sur_refl_b07'
+    })
+}
+
+def _deferred_image_stats(ee, dataset, bands, scale, start_iso, end_iso, region):
+    """Build (without fetching) an ee.List with one statistics row per band"""
+    collection_id, band_mapping = _STATS_DATASETS[dataset]
+    
+    # Filter collection
+    image = ee.ImageCollection(collection_id).filterBounds(region) \
+                                             .filterDate(start_iso, end_iso) \
+                                             .median()
+    
+    # Select bands
+    band_pairs = [(band, band_mapping[band]) for band in bands if band in band_mapping]
+    image = image.select([ee_band for _, ee_band in band_pairs])
+    
+    # Calculate statistics - kept server-side until getInfo
+    stats = image.reduceRegion(
+        reducer=ee.Reducer.mean().combine(
+            ee.Reducer.stdDev(), '', True
+        ).combine(
+            ee.Reducer.minMax(), '', True
+        ).combine(
+            ee.Reducer.median(), '', True
+        ),
+        geometry=region,
+        scale=scale,
+        maxPixels=1e9,
+        bestEffort=True,
+        tileScale=4
     )
     
-    if analysis_type == "📈 Image Statistics":
-        show_image_statistics()
-    elif analysis_type == "🎯 Zonal Statistics":
-        show_zonal_statistics()
-    elif analysis_type == "🔢 Spectral Indices":
-        show_spectral_indices()
-    elif analysis_type == "🏷️ Image Classification":
-        show_classification()
-    elif analysis_type == "🔍 Change Detection":
-        show_change_detection()
+    # Format results server-side as an ee.List of rows, so all bands come back
+    # in one call and the request graph doesn't grow with the band count
+    display_names = ee.Dictionary({ee_band: band for band, ee_band in band_pairs})
+    
+    def to_row(ee_band):
+        ee_band = ee.String(ee_band)
+        return ee.Dictionary({
+            'Band': display_names.get(ee_band),
+            'Mean': stats.get(ee_band.cat('_mean'), 0),
+            'Std': stats.get(ee_band.cat('_stdDev'), 0),
+            'Min': stats.get(ee_band.cat('_min'), 0),
+            'Max': stats.get(ee_band.cat('_max'), 0),
+            'Median': stats.get(ee_band.cat('_median'), 0)
+        })
+    
+    return ee.List([ee_band for _, ee_band in band_pairs]).map(to_row)
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def _compute_image_stats(dataset: str, bands: tuple, scale: int, start_iso: str, end_iso: str, aoi_geojson: str) -> list:
+    """Reduce a median composite over the AOI, returning one row dict per band
+
+    Every input that changes the answer is an argument, so identical requests
+    are served from the cache instead of another Earth Engine round-trip.
+    """
+    ee = _ensure_ee()
+    region = _to_ee_geometry(aoi_geojson)
+    return _deferred_image_stats(ee, dataset, bands, scale, start_iso, end_iso, region).getInfo()
+
+# Charts use Plotly's own template and no mode bar, so Streamlit doesn't
+# restyle the figure spec on every rerun
+_PLOTLY_CONFIG = {'displayModeBar': False}
+
+# Demo statistic ranges (low, high) for Mean, Std, Min, Max, Median
+_DEMO_STAT_NAMES = ['Mean', 'Std', 'Min', 'Max', 'Median']
+_DEMO_STAT_LOW = (0.1, 0.05, 0.0, 0.4, 0.15)
+_DEMO_STAT_HIGH = (0.3, 0.15, 0.1, 0.8, 0.25)
+
+def _demo_stats(bands):
+    """Random sample statistics for the selected bands, drawn in one RNG call"""
+    import numpy as np
+    import pandas as pd
+    low = np.array(_DEMO_STAT_LOW)[:, None]
+    high = np.array(_DEMO_STAT_HIGH)[:, None]
+    values = _rng().uniform(low, high, size=(len(_DEMO_STAT_NAMES), len(bands)))
+    return pd.DataFrame({'Band': pd.Categorical(bands), **dict(zip(_DEMO_STAT_NAMES, values))})
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _stats_bar(df):
+    """Grouped Mean/Median bar chart for a statistics table, built once per table"""
+    import plotly.express as px
+    return px.bar(df, x='Band', y=['Mean', 'Median'],
+                  title="Band Statistics Comparison",
+                  barmode='group')
+
+# Statistics tables kept per session for revisiting earlier settings
+_STATS_CACHE_ENTRIES = 16
+
+def _cache_result(cache, key, value, max_entries):
+    """Store a per-session result, evicting the oldest entry once the cache is full"""
+    if key not in cache and len(cache) >= max_entries:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
 
 def show_image_statistics():
     """Image statistics interface"""
     
+    import pandas as pd
+    
     st.markdown("### 📈 Image Statistics")
     st.markdown("Calculate comprehensive statistics for satellite imagery")
     
@@ -1001,79 +1195,32 @@ def show_image_statistics():
         with col_end:
             end_date = st.date_input("End date:", datetime(2023, 12, 31).date())
         
+        # Results are kept per parameter set, so going back to earlier
+        # settings shows their statistics again without recomputing
+        stats_key = (
+            dataset, tuple(bands), scale,
+            start_date.isoformat(), end_date.isoformat(),
+            _aoi_key() if use_aoi else None
+        )
+        stats_cache = st.session_state.setdefault('stats_cache', {})
+        
         if st.button("📊 Calculate Statistics"):
             with st.spinner("Calculating statistics..."):
                 if use_aoi and EE_AVAILABLE and GEOMASTERPY_AVAILABLE:
                     try:
-                        import ee
-                        
-                        # Initialize Earth Engine
-                        ee.Initialize()
-                        
-                        # Get the AOI geometry
-                        region = st.session_state.aoi_geometry
-                        
-                        # Select appropriate dataset
-                        if dataset == "Landsat 8":
-                            collection = ee.ImageCollection('LANDSAT/LC08/C02/T1_L2')
-                            band_mapping = {
-                                'Blue': 'SR_B2', 'Green': 'SR_B3', 'Red': 'SR_B4',
-                                'NIR': 'SR_B5', 'SWIR1': 'SR_B6', 'SWIR2': 'SR_B7'
-                            }
-                        elif dataset == "Sentinel-2":
-                            collection = ee.ImageCollection('COPERNICUS/S2_SR_HARMONIZED')
-                            band_mapping = {
-                                'Blue': 'B2', 'Green': 'B3', 'Red': 'B4',
-                                'NIR': 'B8', 'SWIR1': 'B11', 'SWIR2': 'B12'
-                            }
-                        else:  # MODIS
-                            collection = ee.ImageCollection('MODIS/061/MOD09A1')
-                            band_mapping = {
-                                'Red': 'sur_refl_b01', 'NIR': 'sur_refl_b02',
-                                'Blue': 'sur_refl_b03', 'Green': 'sur_refl_b04',
-                                'SWIR1': 'sur_refl_b06', 'SWIR2': 'sur_refl_b07'
-                            }
-                        
-                        # Filter collection
-                        image = collection.filterBounds(region) \
-                                        .filterDate(start_date.isoformat(), end_date.isoformat()) \
-                                        .median()
-                        
-                        # Select bands
-                        selected_bands = [band_mapping[band] for band in bands if band in band_mapping]
-                        image = image.select(selected_bands)
-                        
-                        # Calculate statistics
-                        stats = image.reduceRegion(
-                            reducer=ee.Reducer.mean().combine(
-                                ee.Reducer.stdDev(), '', True
-                            ).combine(
-                                ee.Reducer.minMax(), '', True
-                            ).combine(
-                                ee.Reducer.median(), '', True
-                            ),
-                            geometry=region,
-                            scale=scale,
-                            maxPixels=1e9
-                        ).getInfo()
-                        
-                        # Format results
-                        results = []
-                        for i, band in enumerate(bands):
-                            if band in band_mapping:
-                                ee_band = band_mapping[band]
-                                results.append({
-                                    'Band': band,
-                                    'Mean': stats.get(f'{ee_band}_mean', 0),
-                                    'Std': stats.get(f'{ee_band}_stdDev', 0),
-                                    'Min': stats.get(f'{ee_band}_min', 0),
-                                    'Max': stats.get(f'{ee_band}_max', 0),
-                                    'Median': stats.get(f'{ee_band}_median', 0)
-                                })
+                        # Cached per (dataset, bands, scale, dates, AOI)
+                        results = _compute_image_stats(
+                            dataset,
+                            tuple(bands),
+                            scale,
+                            start_date.isoformat(),
+                            end_date.isoformat(),
+                            _aoi_key()
+                        )
                         
                         if results:
-                            real_stats = pd.DataFrame(results)
-                            st.session_state['stats'] = real_stats
+                            real_stats = pd.DataFrame(results).astype({'Band': 'category'})
+                            _cache_result(stats_cache, stats_key, real_stats, _STATS_CACHE_ENTRIES)
                             st.success(f"✅ Calculated statistics for {st.session_state.aoi_name}")
                         else:
                             st.error("No valid data found for the selected bands and region")
@@ -1082,50 +1229,48 @@ def show_image_statistics():
                         st.error(f"Error calculating real statistics: {str(e)}")
                         st.info("Falling back to demo data...")
                         # Fall back to demo data
-                        demo_stats = pd.DataFrame({
-                            'Band': bands,
-                            'Mean': np.random.uniform(0.1, 0.3, len(bands)),
-                            'Std': np.random.uniform(0.05, 0.15, len(bands)),
-                            'Min': np.random.uniform(0.0, 0.1, len(bands)),
-                            'Max': np.random.uniform(0.4, 0.8, len(bands)),
-                            'Median': np.random.uniform(0.15, 0.25, len(bands))
-                        })
-                        st.session_state['stats'] = demo_stats
+                        _cache_result(stats_cache, stats_key, _demo_stats(bands), _STATS_CACHE_ENTRIES)
                 else:
                     # Demo statistics for when AOI is not available or EE not initialized
-                    demo_stats = pd.DataFrame({
-                        'Band': bands,
-                        'Mean': np.random.uniform(0.1, 0.3, len(bands)),
-                        'Std': np.random.uniform(0.05, 0.15, len(bands)),
-                        'Min': np.random.uniform(0.0, 0.1, len(bands)),
-                        'Max': np.random.uniform(0.4, 0.8, len(bands)),
-                        'Median': np.random.uniform(0.15, 0.25, len(bands))
-                    })
-                    st.session_state['stats'] = demo_stats
+                    _cache_result(stats_cache, stats_key, _demo_stats(bands), _STATS_CACHE_ENTRIES)
                     if not use_aoi:
                         st.info("📍 These are sample statistics. Load an Area of Interest for real analysis.")
     
     with col2:
         st.markdown("#### Results")
         
-        if 'stats' in st.session_state:
-            df = st.session_state['stats']
+        df = stats_cache.get(stats_key)
+        if df is not None:
             st.dataframe(df, use_container_width=True)
             
             # Visualization
             if PLOTLY_AVAILABLE:
-                fig = px.bar(df, x='Band', y=['Mean', 'Median'], 
-                            title="Band Statistics Comparison",
-                            barmode='group')
-                st.plotly_chart(fig, use_container_width=True)
+                fig = _stats_bar(df)
+                st.plotly_chart(fig, use_container_width=True, theme=None, config=_PLOTLY_CONFIG)
             else:
                 st.warning("⚠️ Plotly not available - visualization disabled")
         else:
             st.info("👈 Configure settings and click 'Calculate Statistics'")
 
+@st.cache_data(show_spinner=False)
+def _month_starts(start, end):
+    """Monthly DatetimeIndex for the demo time series, built once per range"""
+    import pandas as pd
+    return pd.date_range(start, end, freq='MS')
+
+# Demo (offset, seasonal amplitude, noise sd) per index: vegetation follows the
+# season, water the inverse; other indices are drawn uniformly
+_DEMO_INDEX_SEASONAL = {
+    "NDVI": (0.4, 0.3, 0.05),
+    "NDWI": (0.2, -0.15, 0.03)
+}
+
 def show_spectral_indices():
     """Spectral indices calculation interface"""
     
+    import numpy as np
+    import pandas as pd
+    
     st.markdown("### 🔢 Spectral Indices")
     st.markdown("Calculate vegetation, water, and urban indices")
     
@@ -1138,31 +1283,28 @@ def show_spectral_indices():
     
     if indices:
         # Create sample time series data
-        dates = pd.date_range('2023-01-01', '2023-12-31', freq='M')
-        
-        # Generate demo data for each index
-        data = {}
-        for index in indices:
-            if index == "NDVI":
-                # Seasonal vegetation pattern
-                base = 0.4 + 0.3 * np.sin(2 * np.pi * np.arange(len(dates)) / 12)
-                noise = np.random.normal(0, 0.05, len(dates))
-                data[index] = base + noise
-            elif index == "NDWI":
-                # Water index - inverse seasonal pattern
-                base = 0.2 - 0.15 * np.sin(2 * np.pi * np.arange(len(dates)) / 12)
-                noise = np.random.normal(0, 0.03, len(dates))
-                data[index] = base + noise
-            else:
-                # Random pattern for other indices
-                data[index] = np.random.uniform(-0.2, 0.6, len(dates))
+        dates = _month_starts('2023-01-01', '2023-12-31')
+        
+        # Generate demo data for all indices as one (indices, dates) matrix
+        T = len(dates)
+        season = np.sin(2 * np.pi * np.arange(T) / 12)
+        params = np.array([_DEMO_INDEX_SEASONAL.get(index, (np.nan,) * 3) for index in indices])
+        offset, amplitude, noise_sd = params[:, 0:1], params[:, 1:2], params[:, 2:3]
+        seasonal = offset + amplitude * season + noise_sd * _rng().standard_normal((len(indices), T))
+        # Random pattern for indices without a seasonal profile
+        values = np.where(np.isnan(offset), _rng().uniform(-0.2, 0.6, (len(indices), T)), seasonal)
         
-        df = pd.DataFrame(data, index=dates)
+        df = pd.DataFrame(values.T, index=dates, columns=indices)
         
         # Display time series
+        try:
+            import plotly.express as px
+        except ImportError:
+            st.error("❌ Plotly Missing. Run: pip install plotly")
+            return
         fig = px.line(df, title="Spectral Indices Time Series", 
                      labels={'index': 'Date', 'value': 'Index Value'})
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, theme=None, config=_PLOTLY_CONFIG)
         
         # Statistics table
         st.markdown("#### Index Statistics")
@@ -1189,67 +1331,94 @@ def show_visualizations():
     
     st.markdown("## 📈 Advanced Visualizations")
     
-    viz_type = st.selectbox(
-        "Choose visualization type:",
-        [
-            "📊 Time Series Charts",
-            "📈 Histograms", 
-            "🗺️ Interactive Plots",
-            "🎬 Animations",
-            "📋 Legends & Colorbars"
-        ]
+    viz_type = st.selectbox("Choose visualization type:", list(VISUALIZATION_TOOLS))
+    VISUALIZATION_TOOLS[viz_type]()
+
+_TIME_SERIES_PANELS = [
+    ('NDVI', 'NDVI', 'green'),
+    ('Temperature', 'Temperature (°C)', 'red'),
+    ('Precipitation', 'Precipitation (mm)', 'blue')
+]
+
+@st.cache_data(show_spinner=False)
+def _demo_time_series():
+    """Monthly NDVI, temperature and precipitation demo series for 2020-2023"""
+    import numpy as np
+    import pandas as pd
+    dates = _month_starts('2020-01-01', '2023-12-31')
+    
+    # Shared seasonal signals and one noise draw for all three series
+    T = len(dates)
+    t = np.arange(T)
+    season = np.sin(2 * np.pi * t / 12)
+    season_shifted = np.sin(2 * np.pi * (t + 3) / 12)
+    noise = _rng().standard_normal((3, T))
+    
+    # NDVI with seasonal pattern, temperature, and precipitation (3 months offset)
+    ndvi = 0.4 + 0.3 * season + 0.05 * noise[0]
+    temp = 15 + 10 * season + 2 * noise[1]
+    precip = 50 + 30 * season_shifted + 10 * noise[2]
+    
+    return pd.DataFrame(
+        np.column_stack([ndvi, temp, precip]),
+        index=dates,
+        columns=['NDVI', 'Temperature', 'Precipitation']
     )
-    
-    if viz_type == "📊 Time Series Charts":
-        show_time_series_viz()
-    elif viz_type == "📈 Histograms":
-        show_histogram_viz()
-    elif viz_type == "🗺️ Interactive Plots":
-        show_interactive_plots()
-    elif viz_type == "🎬 Animations":
-        show_animations()
-    elif viz_type == "📋 Legends & Colorbars":
-        show_legends_colorbars()
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _time_series_png(df) -> bytes:
+    """Render the three time series panels to a PNG with matplotlib's OO API, once per table"""
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=(8, 6))
+    axes = fig.subplots(3, 1, sharex=True)
+    for ax, (column, title, color) in zip(axes, _TIME_SERIES_PANELS):
+        ax.plot(df.index, df[column], color=color)
+        ax.set_title(title, fontsize=10)
+    axes[-1].set_xlabel('Date')
+    fig.suptitle('Environmental Time Series')
+    fig.tight_layout()
+    buf = BytesIO()
+    fig.savefig(buf, format='png', dpi=110)
+    return buf.getvalue()
 
 def show_time_series_viz():
     """Time series visualization"""
     
     st.markdown("### 📊 Time Series Visualization")
     
-    # Generate sample time series data
-    dates = pd.date_range('2020-01-01', '2023-12-31', freq='M')
-    
-    # NDVI time series with seasonal pattern
-    ndvi = 0.4 + 0.3 * np.sin(2 * np.pi * np.arange(len(dates)) / 12) + np.random.normal(0, 0.05, len(dates))
-    
-    # Temperature data
-    temp = 15 + 10 * np.sin(2 * np.pi * np.arange(len(dates)) / 12) + np.random.normal(0, 2, len(dates))
+    # Sample time series data, generated once per process
+    df = _demo_time_series()
     
-    # Precipitation data
-    precip = 50 + 30 * np.sin(2 * np.pi * (np.arange(len(dates)) + 3) / 12) + np.random.normal(0, 10, len(dates))
+    # The PNG is rendered once and served from cache; Plotly only on request
+    interactive = st.toggle("Interactive charts", value=False) or not MATPLOTLIB_AVAILABLE
     
-    df = pd.DataFrame({
-        'NDVI': ndvi,
-        'Temperature': temp,
-        'Precipitation': precip
-    }, index=dates)
-    
-    # Create subplot
-    fig = make_subplots(
-        rows=3, cols=1,
-        subplot_titles=['NDVI', 'Temperature (°C)', 'Precipitation (mm)'],
-        vertical_spacing=0.1
-    )
-    
-    # Add traces
-    fig.add_trace(go.Scatter(x=df.index, y=df['NDVI'], name='NDVI', line=dict(color='green')), row=1, col=1)
-    fig.add_trace(go.Scatter(x=df.index, y=df['Temperature'], name='Temperature', line=dict(color='red')), row=2, col=1)
-    fig.add_trace(go.Scatter(x=df.index, y=df['Precipitation'], name='Precipitation', line=dict(color='blue')), row=3, col=1)
-    
-    fig.update_layout(height=600, title_text="Environmental Time Series")
-    fig.update_xaxes(title_text="Date", row=3, col=1)
-    
-    st.plotly_chart(fig, use_container_width=True)
+    if not interactive:
+        st.image(_time_series_png(df))
+    else:
+        # Create subplot
+        try:
+            import plotly.graph_objects as go
+            from plotly.subplots import make_subplots
+        except ImportError:
+            st.error("❌ Plotly Missing. Run: pip install plotly")
+            return
+        fig = make_subplots(
+            rows=3, cols=1,
+            subplot_titles=[title for _, title, _ in _TIME_SERIES_PANELS],
+            vertical_spacing=0.1
+        )
+        
+        # Add traces in one batch, one series per row
+        traces = [
+            go.Scatter(x=df.index, y=df[column], name=column, line=dict(color=color))
+            for column, _, color in _TIME_SERIES_PANELS
+        ]
+        fig.add_traces(traces, rows=[1, 2, 3], cols=[1, 1, 1])
+        
+        fig.update_layout(height=600, title_text="Environmental Time Series")
+        fig.update_xaxes(title_text="Date", row=3, col=1)
+        
+        st.plotly_chart(fig, use_container_width=True, theme=None, config=_PLOTLY_CONFIG)
     
     # Statistics
     col1, col2, col3 = st.columns(3)
@@ -1263,12 +1432,103 @@ def show_time_series_viz():
     with col3:
         st.metric("Avg Precipitation", f"{df['Precipitation'].mean():.1f}mm", f"{df['Precipitation'].std():.1f}")
 
+@st.cache_resource(show_spinner=False)
+def _preview_grid():
+    """Sample NDVI-like raster (X, Y, Z) for the map previews, computed once"""
+    import numpy as np
+    x = np.linspace(-125, -65, 100)
+    y = np.linspace(20, 50, 80)
+    X, Y = np.meshgrid(x, y)
+    Z = np.sin((X + 95) / 10) * np.cos((Y - 35) / 8) * 0.5 + 0.3
+    return X, Y, Z
+
+def _build_preview_fig(colormap: str, gridlines: bool, title: str):
+    """Contour preview figure for the publication map page
+
+    Built with matplotlib.figure.Figure rather than pyplot so the figure is
+    not tracked (and kept alive) by pyplot's global figure manager.
+    """
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    
+    # Create the map
+    X, Y, Z = _preview_grid()
+    im = ax.contourf(X, Y, Z, levels=20, cmap=colormap, vmin=-1, vmax=1)
+    
+    # Customize based on settings
+    if gridlines:
+        ax.grid(True, alpha=0.3)
+    
+    ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+    ax.set_xlabel('Longitude (°)')
+    ax.set_ylabel('Latitude (°)')
+    
+    # Add colorbar
+    cbar = fig.colorbar(im, ax=ax, shrink=0.8)
+    cbar.set_label('NDVI')
+    
+    # Style improvements
+    ax.set_aspect('equal')
+    fig.tight_layout()
+    return fig
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _preview_png(colormap: str, gridlines: bool, title: str) -> bytes:
+    """PNG of the preview figure with its title
+
+    Each call renders its own Figure, so concurrent sessions never share
+    mutable matplotlib state; the PNG bytes are what gets cached.
+    """
+    buf = BytesIO()
+    _build_preview_fig(colormap, gridlines, title).savefig(buf, format='png', dpi=110, bbox_inches='tight')
+    return buf.getvalue()
+
+_PUBLICATION_SNIPPET = """import geomasterpy as gmp
+import ee
+
+# Load Earth Engine data
+image = ee.Image('your_image_id')
+region = ee.Geometry.Rectangle([-125, 20, -65, 50])
+
+# Create publication map
+fig = gmp.plot_ee_image_cartopy(
+    image=image,
+    vis_params={{'min': -1, 'max': 1, 'palette': ['{colormap}']}},
+    region=region,
+    figsize=(12, 8),
+    title='{title}',
+    projection='{projection}',
+    add_colorbar=True,
+    add_gridlines={gridlines}
+)
+
+# Save high-resolution map
+gmp.plotting.save_publication_map(
+    fig, 
+    'publication_map.{ext}', 
+    dpi={dpi}, 
+    format='{ext}'
+)
+"""
+
+def _publication_snippet(colormap, title, projection, format_type, dpi, gridlines):
+    """Fill in the publication map code example for the current settings"""
+    return _PUBLICATION_SNIPPET.format(colormap=colormap, title=title, projection=projection,
+                                       ext=format_type.lower(), dpi=dpi, gridlines=gridlines)
+
 def show_publication_maps():
     """Publication quality maps interface"""
     
     st.markdown("## 🖼️ Publication Quality Maps")
     st.markdown("Create high-resolution maps for scientific publications")
     
+    _publication_map_panel()
+
+@_fragment
+def _publication_map_panel():
+    """Settings, preview and code example; changing a setting reruns only this panel"""
+    
     col1, col2 = st.columns([1, 2])
     
     with col1:
@@ -1306,34 +1566,12 @@ def show_publication_maps():
         st.markdown("### Map Preview")
         
         # Create sample publication map
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        # Generate sample spatial data
-        x = np.linspace(-125, -65, 100)
-        y = np.linspace(20, 50, 80)
-        X, Y = np.meshgrid(x, y)
-        Z = np.sin((X + 95) / 10) * np.cos((Y - 35) / 8) * 0.5 + 0.3
-        
-        # Create the map
-        im = ax.contourf(X, Y, Z, levels=20, cmap=colormap, vmin=-1, vmax=1)
-        
-        # Customize based on settings
-        if "Gridlines" in include_features:
-            ax.grid(True, alpha=0.3)
-        
-        ax.set_xlabel('Longitude (°)')
-        ax.set_ylabel('Latitude (°)')
-        ax.set_title(map_title, fontsize=14, fontweight='bold', pad=20)
-        
-        # Add colorbar
-        cbar = plt.colorbar(im, ax=ax, shrink=0.8)
-        cbar.set_label('NDVI')
+        if not MATPLOTLIB_AVAILABLE:
+            st.error("❌ Matplotlib Missing. Run: pip install matplotlib")
+            return
         
-        # Style improvements
-        ax.set_aspect('equal')
-        plt.tight_layout()
-        
-        st.pyplot(fig)
+        # Rendered once per colormap/gridlines/title; repeat views skip Matplotlib
+        st.image(_preview_png(colormap, "Gridlines" in include_features, map_title))
         
         # Generate download
         if st.button("📥 Generate High-Resolution Map"):
@@ -1343,34 +1581,9 @@ def show_publication_maps():
     
     # Code example
     with st.expander("💻 Code Example"):
-        st.code(f"""
-import geomasterpy as gmp
-import ee
-
-# Load Earth Engine data
-image = ee.Image('your_image_id')
-region = ee.Geometry.Rectangle([-125, 20, -65, 50])
-
-# Create publication map
-fig = gmp.plot_ee_image_cartopy(
-    image=image,
-    vis_params={{'min': -1, 'max': 1, 'palette': ['{colormap}']}},
-    region=region,
-    figsize=(12, 8),
-    title='{map_title}',
-    projection='{projection}',
-    add_colorbar=True,
-    add_gridlines={'Gridlines' in include_features}
-)
-
-# Save high-resolution map
-gmp.plotting.save_publication_map(
-    fig, 
-    'publication_map.{format_type.lower()}', 
-    dpi={resolution}, 
-    format='{format_type.lower()}'
-)
-        """)
+        st.code(_publication_snippet(
+            colormap, map_title, projection, format_type, resolution, "Gridlines" in include_features
+        ))
 
 def show_export_tools():
     """Data export interface"""
@@ -1378,27 +1591,62 @@ def show_export_tools():
     st.markdown("## 💾 Export Tools")
     st.markdown("Export your analysis results and data")
     
-    export_type = st.selectbox(
-        "Export Type:",
-        [
-            "🖼️ Export Images",
-            "📊 Export Vector Data", 
-            "📈 Export Statistics",
-            "⏱️ Export Time Series",
-            "☁️ Export to Google Drive"
-        ]
-    )
-    
-    if export_type == "🖼️ Export Images":
-        show_image_export()
-    elif export_type == "📊 Export Vector Data":
-        show_vector_export()
-    elif export_type == "📈 Export Statistics":
-        show_stats_export()
-    elif export_type == "⏱️ Export Time Series":
-        show_timeseries_export()
-    elif export_type == "☁️ Export to Google Drive":
-        show_drive_export()
+    export_type = st.selectbox("Export Type:", list(EXPORT_TOOLS))
+    EXPORT_TOOLS[export_type]()
+
+@st.cache_resource(show_spinner=False)
+def _export_preview():
+    """Decorative 50x50 float32 gradient for the export preview, built once per process"""
+    import numpy as np
+    ramp = np.linspace(0, 1, 50, dtype=np.float32)
+    return np.add.outer(ramp, ramp)
+
+@st.cache_data(show_spinner=False)
+def _export_preview_png() -> bytes:
+    """PNG of the sample export preview
+
+    Built with matplotlib.figure.Figure so it never enters pyplot's global
+    figure registry.
+    """
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=(6, 4))
+    ax = fig.subplots()
+    
+    im = ax.imshow(_export_preview(), cmap='RdYlGn')
+    ax.set_title('Export Preview')
+    ax.set_xlabel('X (pixels)')
+    ax.set_ylabel('Y (pixels)')
+    
+    fig.colorbar(im, ax=ax, label='Values')
+    buf = BytesIO()
+    fig.savefig(buf, format='png', dpi=110, bbox_inches='tight')
+    return buf.getvalue()
+
+@_fragment
+def _image_export_settings():
+    """Export settings column; its widgets rerun only this column"""
+    st.markdown("#### Export Settings")
+    
+    file_format = st.selectbox("Format:", ["GeoTIFF", "PNG", "JPEG"])
+    scale = st.number_input("Scale (meters):", 10, 1000, 30)
+    compression = st.selectbox("Compression:", ["LZW", "DEFLATE", "None"])
+    
+    # Demo export
+    if st.button("📥 Export Image"):
+        st.success("✅ Image export started!")
+        st.info("📁 File will be saved to your downloads folder")
+        
+        # Show export code
+        st.code(f"""
+# Export with GeoMasterPy
+gmp.export_image_to_local(
+    image=your_image,
+    filename='exported_image',
+    region=your_region,
+    scale={scale},
+    file_format='{file_format}'
+)
+        """)
 
 def show_image_export():
     """Image export interface"""
@@ -1408,71 +1656,24 @@ def show_image_export():
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("#### Export Settings")
-        
-        file_format = st.selectbox("Format:", ["GeoTIFF", "PNG", "JPEG"])
-        scale = st.number_input("Scale (meters):", 10, 1000, 30)
-        compression = st.selectbox("Compression:", ["LZW", "DEFLATE", "None"])
-        
-        # Demo export
-        if st.button("📥 Export Image"):
-            st.success("✅ Image export started!")
-            st.info("📁 File will be saved to your downloads folder")
-            
-            # Show export code
-            st.code(f"""
-# Export with GeoMasterPy
-gmp.export_image_to_local(
-    image=your_image,
-    filename='exported_image',
-    region=your_region,
-    scale={scale},
-    file_format='{file_format}'
-)
-            """)
+        _image_export_settings()
     
     with col2:
         st.markdown("#### Export Preview")
         
-        # Create a sample export preview
-        fig, ax = plt.subplots(figsize=(6, 4))
-        
-        # Generate sample data
-        data = np.random.rand(50, 50)
-        im = ax.imshow(data, cmap='RdYlGn')
-        ax.set_title('Export Preview')
-        ax.set_xlabel('X (pixels)')
-        ax.set_ylabel('Y (pixels)')
-        
-        plt.colorbar(im, ax=ax, label='Values')
-        st.pyplot(fig)
+        # Sample export preview, rendered to PNG once per process
+        if not MATPLOTLIB_AVAILABLE:
+            st.error("❌ Matplotlib Missing. Run: pip install matplotlib")
+            return
+        st.image(_export_preview_png())
 
 def show_documentation():
     """Documentation and help"""
     
     st.markdown("## 📚 Documentation & Help")
     
-    doc_section = st.selectbox(
-        "Documentation Section:",
-        [
-            "🚀 Getting Started",
-            "📖 API Reference",
-            "💡 Examples & Tutorials", 
-            "❓ FAQ",
-            "🔧 Troubleshooting"
-        ]
-    )
-    
-    if doc_section == "🚀 Getting Started":
-        show_getting_started()
-    elif doc_section == "📖 API Reference":
-        show_api_reference()
-    elif doc_section == "💡 Examples & Tutorials":
-        show_examples()
-    elif doc_section == "❓ FAQ":
-        show_faq()
-    elif doc_section == "🔧 Troubleshooting":
-        show_troubleshooting()
+    doc_section = st.selectbox("Documentation Section:", list(DOC_SECTIONS))
+    DOC_SECTIONS[doc_section]()
 
 def show_getting_started():
     """Getting started documentation"""
@@ -1520,57 +1721,54 @@ def show_getting_started():
     - **Export**: Save results to files or cloud storage
     """)
 
+# Documented functions per module: (signature, summary)
+_API_MODULES = {
+    "Map": [
+        ("Map()", "Create interactive map widget"),
+        ("add_ee_layer()", "Add Earth Engine layer to map"),
+        ("add_basemap()", "Add basemap layer"),
+        ("set_center()", "Set map center and zoom")
+    ],
+    "Data": [
+        ("search_ee_data()", "Search Earth Engine catalog"),
+        ("js_snippet_to_python()", "Convert JavaScript to Python"),
+        ("get_dataset_info()", "Get dataset metadata")
+    ],
+    "Analysis": [
+        ("image_stats()", "Calculate image statistics"),
+        ("zonal_stats()", "Perform zonal statistics"),
+        ("calculate_indices()", "Compute spectral indices"),
+        ("supervised_classification()", "Classify images")
+    ],
+    "Export": [
+        ("export_image_to_local()", "Export images locally"),
+        ("export_vector_to_local()", "Export vector data"),
+        ("export_to_drive()", "Export to Google Drive")
+    ],
+    "Visualization": [
+        ("add_legend()", "Add custom legend"),
+        ("add_colorbar()", "Add colorbar"),
+        ("create_time_series_chart()", "Create time series"),
+        ("plot_ee_image_cartopy()", "Publication maps")
+    ]
+}
+
 def show_api_reference():
     """API reference documentation"""
     
     st.markdown("### 📖 API Reference")
     
-    api_modules = {
-        "Map": [
-            ("Map()", "Create interactive map widget"),
-            ("add_ee_layer()", "Add Earth Engine layer to map"),
-            ("add_basemap()", "Add basemap layer"),
-            ("set_center()", "Set map center and zoom")
-        ],
-        "Data": [
-            ("search_ee_data()", "Search Earth Engine catalog"),
-            ("js_snippet_to_python()", "Convert JavaScript to Python"),
-            ("get_dataset_info()", "Get dataset metadata")
-        ],
-        "Analysis": [
-            ("image_stats()", "Calculate image statistics"),
-            ("zonal_stats()", "Perform zonal statistics"),
-            ("calculate_indices()", "Compute spectral indices"),
-            ("supervised_classification()", "Classify images")
-        ],
-        "Export": [
-            ("export_image_to_local()", "Export images locally"),
-            ("export_vector_to_local()", "Export vector data"),
-            ("export_to_drive()", "Export to Google Drive")
-        ],
-        "Visualization": [
-            ("add_legend()", "Add custom legend"),
-            ("add_colorbar()", "Add colorbar"),
-            ("create_time_series_chart()", "Create time series"),
-            ("plot_ee_image_cartopy()", "Publication maps")
-        ]
-    }
-    
-    for module, functions in api_modules.items():
+    for module, functions in _API_MODULES.items():
         with st.expander(f"📦 {module} Module"):
             for func_name, description in functions:
                 st.markdown(f"**`{func_name}`** - {description}")
 
-def show_examples():
-    """Examples and tutorials"""
-    
-    st.markdown("### 💡 Examples & Tutorials")
-    
-    examples = [
-        {
-            "title": "🗺️ Basic Interactive Mapping",
-            "description": "Create your first interactive map with satellite imagery",
-            "code": """
+# Worked examples for the documentation page
+_EXAMPLES = [
+    {
+        "title": "🗺️ Basic Interactive Mapping",
+        "description": "Create your first interactive map with satellite imagery",
+        "code": """
 import geomasterpy as gmp
 import ee
 
@@ -1588,11 +1786,11 @@ Map.add_ee_layer(landsat, {
 
 Map
             """
-        },
-        {
-            "title": "📊 NDVI Time Series Analysis",
-            "description": "Analyze vegetation changes over time",
-            "code": """
+    },
+    {
+        "title": "📊 NDVI Time Series Analysis",
+        "description": "Analyze vegetation changes over time",
+        "code": """
 import geomasterpy as gmp
 import ee
 
@@ -1615,11 +1813,11 @@ chart = gmp.viz.create_time_series_chart(
 )
 chart
             """
-        },
-        {
-            "title": "🏷️ Land Cover Classification",
-            "description": "Classify land cover using machine learning",
-            "code": """
+    },
+    {
+        "title": "🏷️ Land Cover Classification",
+        "description": "Classify land cover using machine learning",
+        "code": """
 import geomasterpy as gmp
 import ee
 
@@ -1647,23 +1845,24 @@ Map.add_ee_layer(classified, {
 
 Map
             """
-        }
-    ]
+    }
+]
+
+def show_examples():
+    """Examples and tutorials"""
+    
+    st.markdown("### 💡 Examples & Tutorials")
     
-    for example in examples:
+    for example in _EXAMPLES:
         with st.expander(example["title"]):
             st.markdown(example["description"])
             st.code(example["code"], language='python')
 
-def show_faq():
-    """FAQ section"""
-    
-    st.markdown("### ❓ Frequently Asked Questions")
-    
-    faqs = [
-        {
-            "question": "How do I authenticate Google Earth Engine?",
-            "answer": """
+# Frequently asked questions for the documentation page
+_FAQS = [
+    {
+        "question": "How do I authenticate Google Earth Engine?",
+        "answer": """
             Run the following in Python:
             ```python
             import ee
@@ -1671,20 +1870,20 @@ def show_faq():
             ee.Initialize()
             ```
             """
-        },
-        {
-            "question": "Can I use GeoMasterPy without Earth Engine?",
-            "answer": """
+    },
+    {
+        "question": "Can I use GeoMasterPy without Earth Engine?",
+        "answer": """
             Yes! Many features work without Earth Engine:
             - Data catalog search
             - JavaScript to Python conversion
             - Basic map creation
             - Static visualizations
             """
-        },
-        {
-            "question": "How do I export large images?",
-            "answer": """
+    },
+    {
+        "question": "How do I export large images?",
+        "answer": """
             For large exports, use Google Drive export:
             ```python
             task = gmp.export.export_image_to_drive(
@@ -1692,39 +1891,40 @@ def show_faq():
             )
             ```
             """
-        },
-        {
-            "question": "What file formats are supported for export?",
-            "answer": """
+    },
+    {
+        "question": "What file formats are supported for export?",
+        "answer": """
             **Images**: GeoTIFF, PNG, JPEG
             **Vectors**: Shapefile, GeoJSON, KML
             **Data**: CSV, JSON
             """
-        }
-    ]
+    }
+]
+
+def show_faq():
+    """FAQ section"""
+    
+    st.markdown("### ❓ Frequently Asked Questions")
     
-    for faq in faqs:
+    for faq in _FAQS:
         with st.expander(faq["question"]):
             st.markdown(faq["answer"])
 
-def show_troubleshooting():
-    """Troubleshooting guide"""
-    
-    st.markdown("### 🔧 Troubleshooting")
-    
-    issues = [
-        {
-            "issue": "Earth Engine authentication errors",
-            "solution": """
+# Common problems and their fixes for the documentation page
+_ISSUES = [
+    {
+        "issue": "Earth Engine authentication errors",
+        "solution": """
             1. Run `ee.Authenticate()` in Python
             2. Follow browser authentication prompts
             3. Ensure you have Earth Engine access
             4. Try `ee.Initialize()` after authentication
             """
-        },
-        {
-            "issue": "Maps not displaying in Jupyter",
-            "solution": """
+    },
+    {
+        "issue": "Maps not displaying in Jupyter",
+        "solution": """
             1. Enable ipyleaflet extension:
                ```bash
                jupyter nbextension enable --py --sys-prefix ipyleaflet
@@ -1732,31 +1932,211 @@ def show_troubleshooting():
             2. Restart Jupyter
             3. Try refreshing the page
             """
-        },
-        {
-            "issue": "Memory errors with large datasets",
-            "solution": """
+    },
+    {
+        "issue": "Memory errors with large datasets",
+        "solution": """
             1. Reduce analysis scale
             2. Filter data by date/region
             3. Use server-side operations when possible
             4. Export large results to Drive instead of local
             """
-        }
-    ]
+    }
+]
+
+def show_troubleshooting():
+    """Troubleshooting guide"""
     
-    for item in issues:
+    st.markdown("### 🔧 Troubleshooting")
+    
+    for item in _ISSUES:
         with st.expander(f"❗ {item['issue']}"):
             st.markdown(item['solution'])
 
+# (Earth Engine output suffix, results column suffix) for each analysis type
+_ZONAL_STAT_SUFFIXES = {
+    "Basic (mean, median)": [('mean', 'mean'), ('median', 'median')],
+    "Extended (mean, std, min, max)": [('mean', 'mean'), ('stdDev', 'std'), ('min', 'min'), ('max', 'max')],
+    "All statistics": [
+        ('mean', 'mean'), ('stdDev', 'std'), ('min', 'min'),
+        ('max', 'max'), ('median', 'median'), ('count', 'count')
+    ]
+}
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _zonal_rename_map(band_pairs):
+    """Earth Engine property -> results column names for (band, ee_band) pairs"""
+    return {
+        f'{ee_band}_{ee_stat}': f'{band}_{stat}'
+        for band, ee_band in band_pairs
+        for ee_stat, stat in _ZONAL_STAT_SUFFIXES["All statistics"]
+    }
+
+# Demo value range for each results column suffix
+_DEMO_ZONAL_RANGES = {
+    'mean': (0.1, 0.3), 'std': (0.05, 0.15), 'min': (0.0, 0.1),
+    'max': (0.4, 0.8), 'median': (0.15, 0.25), 'count': (1000, 5000)
+}
+
+def _demo_zonal_stats(bands, analysis_type, zones):
+    """Random zonal statistics table drawn as one (zones, columns) matrix"""
+    import numpy as np
+    import pandas as pd
+    stats = [stat for _, stat in _ZONAL_STAT_SUFFIXES[analysis_type] if stat != 'count']
+    columns = [f'{band}_{stat}' for band in bands for stat in stats]
+    low, high = np.array([_DEMO_ZONAL_RANGES[stat] for _ in bands for stat in stats]).reshape(-1, 2).T
+    values = _rng().uniform(low, high, size=(zones, len(columns))).round(3)
+    demo_df = pd.DataFrame(values, columns=columns)
+    if analysis_type == "All statistics":
+        # Pixel counts are integers; place each after its band's median as before
+        counts = _rng().integers(*_DEMO_ZONAL_RANGES['count'], size=(zones, len(bands)))
+        for i, band in enumerate(bands):
+            demo_df.insert(demo_df.columns.get_loc(f'{band}_median') + 1, f'{band}_count', counts[:, i])
+    demo_df.insert(0, 'Zone', [f'Zone {i+1}' for i in range(zones)])
+    return demo_df
+
+@st.cache_resource(max_entries=5, show_spinner=False)
+def _get_zones_fc(aoi_key: str):
+    """ee.FeatureCollection of analysis zones for an AOI: its features, or the whole area"""
+    ee = _ensure_ee()
+    aoi_geojson = json.loads(aoi_key)
+    if aoi_geojson.get('type') == 'FeatureCollection' and len(aoi_geojson.get('features', [])) > 1:
+        # Multiple zones
+        return ee.FeatureCollection(aoi_geojson)
+    # Single zone - create a feature collection with one feature
+    return ee.FeatureCollection([ee.Feature(_to_ee_geometry(aoi_key))])
+
+def _session_zones_fc(aoi_key: str):
+    """This session's zones collection, rebuilt only when the AOI changes
+
+    The key is the string stored in session state at load time, so an
+    unchanged AOI is recognised without hashing its GeoJSON again.
+    """
+    if st.session_state.get('ee_zones_key') != aoi_key:
+        st.session_state['ee_zones_fc'] = _get_zones_fc(aoi_key)
+        st.session_state['ee_zones_key'] = aoi_key
+    return st.session_state['ee_zones_fc']
+
+@st.cache_resource(max_entries=5, show_spinner=False)
+def _get_composite(dataset: str, start_iso: str, end_iso: str, aoi_key: str):
+    """Median composite of a dataset over an AOI and date range"""
+    ee = _ensure_ee()
+    collection_id, _ = _STATS_DATASETS[dataset]
+    return ee.ImageCollection(collection_id).filterBounds(_to_ee_geometry(aoi_key)) \
+                                            .filterDate(start_iso, end_iso) \
+                                            .median()
+
+def _zonal_view(df, analysis_type):
+    """Columns of a full zonal statistics table that belong to the selected analysis type"""
+    suffixes = tuple(f'_{stat}' for _, stat in _ZONAL_STAT_SUFFIXES[analysis_type])
+    return df[['Zone'] + [col for col in df.columns if col.endswith(suffixes)]]
+
+def _pixel_weighted_means(df):
+    """Per-band mean over all zones, weighting each zone's mean by its pixel count"""
+    import numpy as np
+    bands = [col[:-len('_count')] for col in df.columns if col.endswith('_count')]
+    if not bands:
+        return {}
+    means = df[[f'{band}_mean' for band in bands]].to_numpy(dtype=float)
+    counts = df[[f'{band}_count' for band in bands]].to_numpy(dtype=float)
+    totals = counts.sum(axis=0)
+    weighted = np.divide((means * counts).sum(axis=0), totals,
+                         out=np.full(len(bands), np.nan), where=totals > 0)
+    return {band: value for band, value, total in zip(bands, weighted, totals) if total > 0}
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _to_csv(df) -> bytes:
+    """CSV bytes for a results table"""
+    return df.to_csv(index=False).encode()
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _to_parquet(df) -> bytes:
+    """Parquet bytes for a results table (needs pyarrow)"""
+    buf = BytesIO()
+    df.to_parquet(buf, index=False)
+    return buf.getvalue()
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _melted(df, bands):
+    """Long-format Zone/Band_Stat/Value table for the selected columns"""
+    return df.melt(id_vars=['Zone'], value_vars=list(bands),
+                   var_name='Band_Stat', value_name='Value')
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _zonal_bar(df, bands):
+    """Zone comparison bar chart, built once per table and band selection"""
+    import plotly.express as px
+    return px.bar(_melted(df, bands), x='Zone', y='Value', color='Band_Stat',
+                  title="Zonal Statistics Comparison", height=400)
+
+@st.cache_resource(show_spinner=False)
+def _zonal_reducer():
+    """Combined mean/stdDev/minMax/median/count reducer, built once Earth Engine is up"""
+    import ee
+    return ee.Reducer.mean().combine(
+        ee.Reducer.stdDev(), '', True
+    ).combine(
+        ee.Reducer.minMax(), '', True
+    ).combine(
+        ee.Reducer.median(), '', True
+    ).combine(
+        ee.Reducer.count(), '', True
+    )
+
+# Zonal result tables kept per session for re-running earlier settings
+_ZONAL_CACHE_ENTRIES = 16
+
+# Zone counts at or above this are exported to Drive rather than fetched
+_ZONAL_EXPORT_THRESHOLD = 1000
+
+# Earth Engine task states after which a Drive export needs no more polling
+_EE_TASK_FINISHED_STATES = ('COMPLETED', 'FAILED', 'CANCELLED')
+
+def _run_zonal_async(image, zones, reducer, scale):
+    """Build the zonal statistics FeatureCollection without fetching it"""
+    return image.reduceRegions(
+        collection=zones,
+        reducer=reducer,
+        scale=scale,
+        crs='EPSG:4326'
+    )
+
+# Zones per reduceRegions request when a large AOI is split into batches
+_ZONAL_BATCH_SIZE = 200
+
+def _fetch_zonal(ee, image, zones, reducer, scale, zone_count, max_workers=8):
+    """Zonal statistics as a DataFrame, reducing large zone sets in parallel batches
+
+    Each batch is its own smaller Earth Engine request, so big AOIs stay
+    clear of per-request limits and the batches run side by side.
+    """
+    def fetch(fc):
+        return ee.data.computeFeatures({
+            'expression': _run_zonal_async(image, fc, reducer, scale),
+            'fileFormat': 'PANDAS_DATAFRAME'
+        })
+
+    if zone_count <= _ZONAL_BATCH_SIZE:
+        return fetch(zones)
+    import pandas as pd
+    from concurrent.futures import ThreadPoolExecutor
+    zone_list = zones.toList(zone_count)
+    batches = [ee.FeatureCollection(zone_list.slice(i, i + _ZONAL_BATCH_SIZE))
+               for i in range(0, zone_count, _ZONAL_BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as pool:
+        return pd.concat(pool.map(fetch, batches), ignore_index=True)
+
 # Helper functions for missing components
 def show_zonal_statistics():
     """Zonal statistics interface with AOI integration"""
     
+    ss = st.session_state
+    
     st.markdown("### 🎯 Zonal Statistics")
     st.markdown("Calculate statistics for different zones within your area of interest")
     
     # Check for AOI
-    if st.session_state.get('aoi_geometry') is None:
+    if ss.get('aoi_geometry') is None:
         st.warning("⚠️ Zonal statistics requires an Area of Interest to be defined")
         st.markdown("""
         **To use zonal statistics:**
@@ -1768,17 +2148,17 @@ def show_zonal_statistics():
         """)
         return
     
+    aoi_name = ss.get('aoi_name')
+    aoi_geojson = ss.get('aoi_geojson')
+    
     # Display current AOI info
-    st.success(f"✅ Analyzing zones within: **{st.session_state.get('aoi_name', 'Custom Area')}**")
+    st.success(f"✅ Analyzing zones within: **{aoi_name or 'Custom Area'}**")
     
     # Check if AOI has multiple features for zonal analysis
-    aoi_geojson = st.session_state.get('aoi_geojson')
-    if aoi_geojson and aoi_geojson.get('type') == 'FeatureCollection':
-        num_zones = len(aoi_geojson.get('features', []))
-        if num_zones > 1:
-            st.info(f"📊 Found {num_zones} zones for analysis")
-        else:
-            st.info("ℹ️ Single zone detected. Analysis will calculate statistics for the entire area.")
+    is_collection = bool(aoi_geojson) and aoi_geojson.get('type') == 'FeatureCollection'
+    num_zones = len(aoi_geojson.get('features', [])) if is_collection else 1
+    if num_zones > 1:
+        st.info(f"📊 Found {num_zones} zones for analysis")
     else:
         st.info("ℹ️ Single zone detected. Analysis will calculate statistics for the entire area.")
     
@@ -1799,6 +2179,8 @@ def show_zonal_statistics():
             default=["Red", "NIR", "Green"],
             help="Select bands for statistical analysis"
         )
+        _, band_mapping = _STATS_DATASETS[dataset]
+        selected_bands = tuple(band for band in bands if band in band_mapping)
         
         scale = st.number_input("Analysis scale (meters):", 10, 1000, 30)
         
@@ -1816,121 +2198,70 @@ def show_zonal_statistics():
             index=1
         )
         
+        # Real results (and Drive exports) are kept per parameter set; every statistic
+        # is computed on each run, so the analysis type isn't part of the key
+        zonal_key = (dataset, selected_bands, scale, start_date.isoformat(), end_date.isoformat(), _aoi_key())
+        
         if st.button("🎯 Run Zonal Analysis", type="primary"):
             if not bands:
                 st.error("Please select at least one band for analysis")
                 return
                 
+            zonal_cache = ss.setdefault('zonal_cache', {})
+            
             with st.spinner("Running zonal statistics analysis..."):
-                if EE_AVAILABLE and GEOMASTERPY_AVAILABLE:
+                if zonal_key in zonal_cache:
+                    ss['zonal_stats'] = zonal_cache[zonal_key]
+                    st.success(f"✅ Calculated zonal statistics for {len(zonal_cache[zonal_key])} zones")
+                elif EE_AVAILABLE and GEOMASTERPY_AVAILABLE:
                     try:
-                        import ee
-                        
-                        # Initialize Earth Engine
-                        ee.Initialize()
+                        ee = _ensure_ee()
                         
-                        # Get zones from AOI
-                        if aoi_geojson['type'] == 'FeatureCollection' and len(aoi_geojson['features']) > 1:
-                            # Multiple zones
-                            zones = ee.FeatureCollection(aoi_geojson)
-                        else:
-                            # Single zone - create a feature collection with one feature
-                            zones = ee.FeatureCollection([ee.Feature(st.session_state.aoi_geometry)])
-                        
-                        # Select dataset and bands
-                        if dataset == "Landsat 8":
-                            collection = ee.ImageCollection('LANDSAT/LC08/C02/T1_L2')
-                            band_mapping = {
-                                'Blue': 'SR_B2', 'Green': 'SR_B3', 'Red': 'SR_B4',
-                                'NIR': 'SR_B5', 'SWIR1': 'SR_B6', 'SWIR2': 'SR_B7'
-                            }
-                        elif dataset == "Sentinel-2":
-                            collection = ee.ImageCollection('COPERNICUS/S2_SR_HARMONIZED')
-                            band_mapping = {
-                                'Blue': 'B2', 'Green': 'B3', 'Red': 'B4',
-                                'NIR': 'B8', 'SWIR1': 'B11', 'SWIR2': 'B12'
-                            }
-                        else:  # MODIS
-                            collection = ee.ImageCollection('MODIS/061/MOD09A1')
-                            band_mapping = {
-                                'Red': 'sur_refl_b01', 'NIR': 'sur_refl_b02',
-                                'Blue': 'sur_refl_b03', 'Green': 'sur_refl_b04',
-                                'SWIR1': 'sur_refl_b06', 'SWIR2': 'sur_refl_b07'
-                            }
-                        
-                        # Filter and select image
-                        image = collection.filterBounds(st.session_state.aoi_geometry) \
-                                        .filterDate(start_date.isoformat(), end_date.isoformat()) \
-                                        .median()
+                        # Zones and the filtered median composite are reused across runs
+                        # that only change bands or statistics
+                        aoi_key = _aoi_key()
+                        zones = _session_zones_fc(aoi_key)
+                        image = _get_composite(dataset, start_date.isoformat(), end_date.isoformat(), aoi_key)
                         
                         # Select bands
-                        selected_bands = [band_mapping[band] for band in bands if band in band_mapping]
-                        image = image.select(selected_bands)
-                        
-                        # Choose reducer based on analysis type
-                        if analysis_type == "Basic (mean, median)":
-                            reducer = ee.Reducer.mean().combine(ee.Reducer.median(), '', True)
-                        elif analysis_type == "Extended (mean, std, min, max)":
-                            reducer = ee.Reducer.mean().combine(
-                                ee.Reducer.stdDev(), '', True
-                            ).combine(
-                                ee.Reducer.minMax(), '', True
-                            )
-                        else:  # All statistics
-                            reducer = ee.Reducer.mean().combine(
-                                ee.Reducer.stdDev(), '', True
-                            ).combine(
-                                ee.Reducer.minMax(), '', True
-                            ).combine(
-                                ee.Reducer.median(), '', True
-                            ).combine(
-                                ee.Reducer.count(), '', True
-                            )
-                        
-                        # Calculate zonal statistics
-                        zonal_stats = image.reduceRegions(
-                            collection=zones,
-                            reducer=reducer,
-                            scale=scale,
-                            crs='EPSG:4326'
-                        )
+                        image = image.select([band_mapping[band] for band in selected_bands])
                         
-                        # Get results
-                        results = zonal_stats.getInfo()
+                        # Always compute every statistic server-side; the results panel
+                        # shows the subset for the selected analysis type, so switching
+                        # types doesn't need another Earth Engine run
+                        reducer = _zonal_reducer()
                         
-                        # Process results into a DataFrame
-                        processed_results = []
-                        for i, feature in enumerate(results['features']):
-                            props = feature['properties']
-                            zone_data = {'Zone': f'Zone {i+1}'}
-                            
-                            # Extract statistics for each band
-                            for band in bands:
-                                if band in band_mapping:
-                                    ee_band = band_mapping[band]
-                                    if analysis_type == "Basic (mean, median)":
-                                        zone_data[f'{band}_mean'] = props.get(f'{ee_band}_mean', 0)
-                                        zone_data[f'{band}_median'] = props.get(f'{ee_band}_median', 0)
-                                    elif analysis_type == "Extended (mean, std, min, max)":
-                                        zone_data[f'{band}_mean'] = props.get(f'{ee_band}_mean', 0)
-                                        zone_data[f'{band}_std'] = props.get(f'{ee_band}_stdDev', 0)
-                                        zone_data[f'{band}_min'] = props.get(f'{ee_band}_min', 0)
-                                        zone_data[f'{band}_max'] = props.get(f'{ee_band}_max', 0)
-                                    else:  # All statistics
-                                        zone_data[f'{band}_mean'] = props.get(f'{ee_band}_mean', 0)
-                                        zone_data[f'{band}_std'] = props.get(f'{ee_band}_stdDev', 0)
-                                        zone_data[f'{band}_min'] = props.get(f'{ee_band}_min', 0)
-                                        zone_data[f'{band}_max'] = props.get(f'{ee_band}_max', 0)
-                                        zone_data[f'{band}_median'] = props.get(f'{ee_band}_median', 0)
-                                        zone_data[f'{band}_count'] = props.get(f'{ee_band}_count', 0)
-                            
-                            processed_results.append(zone_data)
+                        # Calculate zonal statistics (deferred - nothing is fetched yet)
+                        zonal_stats = _run_zonal_async(image, zones, reducer, scale)
                         
-                        if processed_results:
-                            zonal_df = pd.DataFrame(processed_results)
-                            st.session_state['zonal_stats'] = zonal_df
-                            st.success(f"✅ Calculated zonal statistics for {len(processed_results)} zones")
+                        export_started = num_zones >= _ZONAL_EXPORT_THRESHOLD
+                        if export_started:
+                            # Too many zones for an interactive fetch - run it as a Drive export
+                            task = ee.batch.Export.table.toDrive(
+                                collection=zonal_stats,
+                                description='zonal_statistics',
+                                fileFormat='CSV'
+                            )
+                            task.start()
+                            ss['zonal_export'] = (zonal_key, task)
+                            st.info(f"📤 {num_zones} zones - started a Google Drive export instead of loading them here")
+                            props_df = None
                         else:
+                            # Fetch every page of results straight into a DataFrame
+                            props_df = _fetch_zonal(ee, image, zones, reducer, scale, num_zones)
+                        
+                        if props_df is not None and len(props_df):
+                            # Process results with one column selection and rename
+                            rename_map = _zonal_rename_map(
+                                tuple((band, band_mapping[band]) for band in selected_bands)
+                            )
+                            zonal_df = props_df.reindex(columns=list(rename_map), fill_value=0) \
+                                               .rename(columns=rename_map)
+                            zonal_df.insert(0, 'Zone', [f'Zone {i+1}' for i in range(len(zonal_df))])
+                            ss['zonal_stats'] = zonal_df
+                            _cache_result(zonal_cache, zonal_key, zonal_df, _ZONAL_CACHE_ENTRIES)
+                            st.success(f"✅ Calculated zonal statistics for {len(zonal_df)} zones")
+                        elif not export_started:
                             st.error("No valid data found for the selected parameters")
                             
                     except Exception as e:
@@ -1938,30 +2269,9 @@ def show_zonal_statistics():
                         st.info("Generating demo data...")
                         
                         # Generate demo data
-                        demo_zones = 3 if aoi_geojson.get('type') == 'FeatureCollection' and len(aoi_geojson.get('features', [])) > 1 else 1
-                        demo_data = []
-                        for i in range(demo_zones):
-                            zone_data = {'Zone': f'Zone {i+1}'}
-                            for band in bands:
-                                if analysis_type == "Basic (mean, median)":
-                                    zone_data[f'{band}_mean'] = round(np.random.uniform(0.1, 0.3), 3)
-                                    zone_data[f'{band}_median'] = round(np.random.uniform(0.15, 0.25), 3)
-                                elif analysis_type == "Extended (mean, std, min, max)":
-                                    zone_data[f'{band}_mean'] = round(np.random.uniform(0.1, 0.3), 3)
-                                    zone_data[f'{band}_std'] = round(np.random.uniform(0.05, 0.15), 3)
-                                    zone_data[f'{band}_min'] = round(np.random.uniform(0.0, 0.1), 3)
-                                    zone_data[f'{band}_max'] = round(np.random.uniform(0.4, 0.8), 3)
-                                else:  # All statistics
-                                    zone_data[f'{band}_mean'] = round(np.random.uniform(0.1, 0.3), 3)
-                                    zone_data[f'{band}_std'] = round(np.random.uniform(0.05, 0.15), 3)
-                                    zone_data[f'{band}_min'] = round(np.random.uniform(0.0, 0.1), 3)
-                                    zone_data[f'{band}_max'] = round(np.random.uniform(0.4, 0.8), 3)
-                                    zone_data[f'{band}_median'] = round(np.random.uniform(0.15, 0.25), 3)
-                                    zone_data[f'{band}_count'] = np.random.randint(1000, 5000)
-                            demo_data.append(zone_data)
-                        
-                        demo_df = pd.DataFrame(demo_data)
-                        st.session_state['zonal_stats'] = demo_df
+                        demo_zones = 3 if num_zones > 1 else 1
+                        demo_df = _demo_zonal_stats(bands, "All statistics", demo_zones)
+                        ss['zonal_stats'] = demo_df
                         st.warning("⚠️ Showing demo data. Real analysis requires Earth Engine authentication.")
                         
                 else:
@@ -1970,18 +2280,46 @@ def show_zonal_statistics():
     with col2:
         st.markdown("#### Results")
         
-        if 'zonal_stats' in st.session_state:
-            df = st.session_state['zonal_stats']
+        # Drive export started for these settings; dropped once it finishes or the inputs change
+        export_key, export_task = ss.get('zonal_export') or (None, None)
+        if export_key is not None and export_key != zonal_key:
+            del ss['zonal_export']
+        elif export_task is not None:
+            if st.button("🔄 Check Drive export status"):
+                try:
+                    state = export_task.status().get('state', 'UNKNOWN')
+                    st.info(f"📤 Drive export: {state}")
+                    if state in _EE_TASK_FINISHED_STATES:
+                        del ss['zonal_export']
+                except Exception as e:
+                    st.error(f"Could not get export status: {str(e)}")
+        
+        zonal_stats = ss.get('zonal_stats')
+        if zonal_stats is not None:
+            df = _zonal_view(zonal_stats, analysis_type)
             st.dataframe(df, use_container_width=True)
             
-            # Download button
-            csv = df.to_csv(index=False)
+            if len(df) > 1:
+                weighted = _pixel_weighted_means(zonal_stats)
+                if weighted:
+                    st.caption("Pixel-weighted mean across zones: " +
+                               ", ".join(f"{band} {value:.3f}" for band, value in weighted.items()))
+            
+            # Download buttons - serialized once per table, not on every rerun
+            file_stem = f"zonal_stats_{(aoi_name or 'area').replace(' ', '_')}"
             st.download_button(
                 label="📥 Download CSV",
-                data=csv,
-                file_name=f"zonal_stats_{st.session_state.get('aoi_name', 'area').replace(' ', '_')}.csv",
+                data=_to_csv(df),
+                file_name=f"{file_stem}.csv",
                 mime="text/csv"
             )
+            if PYARROW_AVAILABLE:
+                st.download_button(
+                    label="📥 Download Parquet",
+                    data=_to_parquet(df),
+                    file_name=f"{file_stem}.parquet",
+                    mime="application/octet-stream"
+                )
             
             # Visualization
             if PLOTLY_AVAILABLE and len(df) > 1:
@@ -1999,14 +2337,8 @@ def show_zonal_statistics():
                     
                     if plot_bands:
                         # Create comparison chart
-                        fig = px.bar(
-                            df.melt(id_vars=['Zone'], value_vars=plot_bands, 
-                                   var_name='Band_Stat', value_name='Value'),
-                            x='Zone', y='Value', color='Band_Stat',
-                            title="Zonal Statistics Comparison",
-                            height=400
-                        )
-                        st.plotly_chart(fig, use_container_width=True)
+                        fig = _zonal_bar(df, tuple(plot_bands))
+                        st.plotly_chart(fig, use_container_width=True, theme=None, config=_PLOTLY_CONFIG)
         else:
             st.info("Run the analysis to see results here")
             
@@ -2050,5 +2382,53 @@ def show_timeseries_export():
 def show_drive_export():
     st.info("Google Drive export interface would be implemented here")
 
+# Sub-page handlers for the analysis, visualization, export and documentation pages
+ANALYSIS_TOOLS = {
+    "📈 Image Statistics": show_image_statistics,
+    "🎯 Zonal Statistics": show_zonal_statistics,
+    "🔢 Spectral Indices": show_spectral_indices,
+    "🏷️ Image Classification": show_classification,
+    "🔍 Change Detection": show_change_detection
+}
+
+VISUALIZATION_TOOLS = {
+    "📊 Time Series Charts": show_time_series_viz,
+    "📈 Histograms": show_histogram_viz,
+    "🗺️ Interactive Plots": show_interactive_plots,
+    "🎬 Animations": show_animations,
+    "📋 Legends & Colorbars": show_legends_colorbars
+}
+
+EXPORT_TOOLS = {
+    "🖼️ Export Images": show_image_export,
+    "📊 Export Vector Data": show_vector_export,
+    "📈 Export Statistics": show_stats_export,
+    "⏱️ Export Time Series": show_timeseries_export,
+    "☁️ Export to Google Drive": show_drive_export
+}
+
+DOC_SECTIONS = {
+    "🚀 Getting Started": show_getting_started,
+    "📖 API Reference": show_api_reference,
+    "💡 Examples & Tutorials": show_examples,
+    "❓ FAQ": show_faq,
+    "🔧 Troubleshooting": show_troubleshooting
+}
+
+# Sidebar page name -> render function, in menu order
+PAGES = {
+    "🏠 Home": show_home,
+    "🌍 Land App (New!)": show_land_app,
+    "📁 Area of Interest": show_area_of_interest,
+    "🗺️ Interactive Maps": show_interactive_maps,
+    "🔍 Data Catalog": show_data_catalog,
+    "🔄 JS to Python Converter": show_js_converter,
+    "📊 Data Analysis": show_data_analysis,
+    "📈 Visualizations": show_visualizations,
+    "💾 Export Tools": show_export_tools,
+    "🖼️ Publication Maps": show_publication_maps,
+    "📚 Documentation": show_documentation
+}
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
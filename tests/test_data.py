@@ -34,6 +34,14 @@ class TestDataCatalog:
             # Should return empty list for non-existent datasets
             assert len(results) == 0
     
+    def test_search_ee_data_keeps_existing_initialization(self):
+        """Test that an already initialized Earth Engine is not re-initialized"""
+        with patch('ee.data.is_initialized', return_value=True), patch('ee.Initialize') as mock_init:
+            results = search_ee_data('landsat', max_results=5)
+            
+            assert len(results) > 0
+            mock_init.assert_not_called()
+    
     def test_js_snippet_to_python_basic(self):
         """Test basic JavaScript to Python conversion"""
         js_code = """
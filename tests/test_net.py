@@ -0,0 +1,22 @@
+"""
+Tests for the shared HTTP session
+"""
+
+import requests
+from geomasterpy.net import SESSION
+
+
+class TestSession:
+    """Test cases for the pooled session"""
+    
+    def test_session_is_shared(self):
+        """Test that the module exposes a single Session instance"""
+        from geomasterpy import net
+        assert isinstance(SESSION, requests.Session)
+        assert net.SESSION is SESSION
+    
+    def test_adapters_mounted_with_retries(self):
+        """Test that both schemes use the pooled adapter with retries"""
+        for prefix in ('http://', 'https://'):
+            adapter = SESSION.get_adapter(prefix + 'example.com')
+            assert adapter.max_retries.total == 3